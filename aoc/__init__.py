@@ -0,0 +1,5 @@
+"""Tools to run and measure the Advent of Code 2023 solutions."""
+
+__author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
+__date__ = "2023"
+__license__ = "MIT"
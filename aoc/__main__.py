@@ -0,0 +1,426 @@
+"""Command line interface."""
+
+__author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
+__date__ = "2023"
+__license__ = "MIT"
+
+import argparse
+import os
+from pathlib import Path
+
+from aoc import (
+    batch,
+    bench,
+    cache,
+    check,
+    chunked,
+    daemon,
+    generators,
+    hooks,
+    profiling,
+    runner,
+    startup,
+    watch,
+)
+
+
+def main() -> None:
+    """Parse command line arguments and dispatch the command."""
+    parser = argparse.ArgumentParser(
+        prog="aoc", description="Advent of Code 2023 tools."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run and time days")
+    run_parser.add_argument(
+        "days",
+        nargs="?",
+        default="1-20",
+        help="days to run, e.g. 1-20 or 1,3,5-7 (default: 1-20)",
+    )
+    run_parser.add_argument(
+        "-o",
+        "--report",
+        default="report.json",
+        help="path of the JSON report (default: report.json)",
+    )
+    run_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="worker processes, 0 for all cores (default: 1)",
+    )
+    run_parser.add_argument(
+        "--hooks",
+        help="comma separated functions to count and time, "
+        "e.g. day_16.Beam.advance",
+    )
+    run_parser.add_argument(
+        "--answer-cache",
+        action="store_true",
+        help="reuse cached answers and cache new ones, "
+        "ignored with --hooks or --memory",
+    )
+    run_parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="trace peak memory and top allocation sites of each star",
+    )
+    run_mode_group = run_parser.add_mutually_exclusive_group()
+    run_mode_group.add_argument(
+        "--split-stars",
+        action="store_true",
+        help="dispatch each star to its own worker",
+    )
+    run_mode_group.add_argument(
+        "--stream",
+        action="store_true",
+        help="solve both stars in one pass over the input lines, "
+        "for the days supporting it",
+    )
+    run_mode_group.add_argument(
+        "--vectorized",
+        action="store_true",
+        help="solve the stars vectorized over the whole input file, "
+        "for the days supporting it",
+    )
+    run_parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="reuse parsed inputs cached on disk",
+    )
+    run_parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=cache.DEFAULT_MAX_BYTES // 2**20,
+        help="size bound of the parsed input cache in MiB "
+        "(default: %(default)s)",
+    )
+
+    batch_parser = subparsers.add_parser(
+        "batch", help="solve many inputs of a day in one process"
+    )
+    batch_parser.add_argument(
+        "day", type=int, choices=runner.DAYS, help="day number"
+    )
+    batch_parser.add_argument(
+        "inputs",
+        nargs="+",
+        help="input directories, files or glob patterns",
+    )
+    batch_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="worker processes, 0 for all cores (default: 1)",
+    )
+    batch_parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="path of the .csv or .json output (default: CSV on standard "
+        "output)",
+    )
+
+    check_parser = subparsers.add_parser(
+        "check",
+        help="check answers and time budgets of the shipped inputs, "
+        "answers of the streaming and chunked modes, and answers of the "
+        "regression inputs",
+    )
+    check_parser.add_argument(
+        "days",
+        nargs="?",
+        default="1-20",
+        help="days to check (default: 1-20)",
+    )
+    check_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="worker processes, 0 for all cores (default: 1)",
+    )
+    budget_group = check_parser.add_mutually_exclusive_group()
+    budget_group.add_argument(
+        "--budget-scale",
+        type=float,
+        default=1.0,
+        help="factor applied to every time budget (default: 1)",
+    )
+    budget_group.add_argument(
+        "--no-budget",
+        action="store_true",
+        help="only check the answers",
+    )
+    check_parser.add_argument(
+        "--save",
+        action="store_true",
+        help="store the current answers as the expected ones",
+    )
+
+    chunked_parser = subparsers.add_parser(
+        "chunked", help="solve a day over chunks of its input in parallel"
+    )
+    chunked_parser.add_argument(
+        "day",
+        type=int,
+        choices=chunked.CHUNKED_DAYS,
+        help="day number",
+    )
+    chunked_parser.add_argument(
+        "input",
+        nargs="?",
+        type=Path,
+        help="input path (default: the shipped input)",
+    )
+    chunked_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=0,
+        help="worker processes, 0 for all cores (default: 0)",
+    )
+    chunked_parser.add_argument(
+        "--chunks",
+        type=int,
+        help=f"number of chunks (default: {chunked.CHUNKS_PER_JOB} per job)",
+    )
+
+    clear_parser = subparsers.add_parser(
+        "clear-cache", help="remove cached answers and parsed inputs"
+    )
+    clear_group = clear_parser.add_mutually_exclusive_group()
+    clear_group.add_argument(
+        "--answers", action="store_true", help="only remove answers"
+    )
+    clear_group.add_argument(
+        "--parsed", action="store_true", help="only remove parsed inputs"
+    )
+
+    generate_parser = subparsers.add_parser(
+        "generate", help="generate a synthetic input"
+    )
+    generate_parser.add_argument("day", type=int, help="day number")
+    size_group = generate_parser.add_mutually_exclusive_group()
+    size_group.add_argument(
+        "--size", type=int, help="input size, e.g. lines or grid side"
+    )
+    size_group.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="amount of data relative to the shipped input (default: 1)",
+    )
+    generate_parser.add_argument(
+        "--seed", type=int, default=0, help="random seed (default: 0)"
+    )
+    generate_parser.add_argument(
+        "-o", "--output", help="output path (default: standard output)"
+    )
+
+    profile_parser = subparsers.add_parser(
+        "profile", help="profile a day with cProfile"
+    )
+    profile_parser.add_argument("day", type=int, help="day number")
+    profile_parser.add_argument(
+        "-o",
+        "--output-dir",
+        type=Path,
+        default=profiling.PROFILES_DIR,
+        help="directory of the .pstats and collapsed stack files",
+    )
+
+    bench_parser = subparsers.add_parser(
+        "bench", help="benchmark days over increasing input sizes"
+    )
+    bench_parser.add_argument(
+        "days",
+        nargs="?",
+        default="1-20",
+        help="days to benchmark (default: 1-20)",
+    )
+    bench_parser.add_argument(
+        "--scales",
+        default=",".join(map(str, bench.DEFAULT_SCALES)),
+        help="comma separated data scale factors (default: %(default)s)",
+    )
+    bench_parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="timed runs per size, the fastest is kept (default: 1)",
+    )
+    bench_parser.add_argument(
+        "--seed", type=int, default=0, help="random seed (default: 0)"
+    )
+    bench_parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="do not measure peak memory",
+    )
+    bench_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=20.0,
+        help="maximum allowed slowdown in percent (default: 20)",
+    )
+    bench_parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=bench.RESULTS_DIR / "baseline.json",
+        help="path of the baseline results",
+    )
+    bench_parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="store the results as the new baseline",
+    )
+
+    serve_parser = subparsers.add_parser(
+        "serve", help="serve solve requests over a Unix domain socket"
+    )
+    serve_parser.add_argument(
+        "--socket",
+        type=Path,
+        default=daemon.SOCKET_PATH,
+        help="path of the socket",
+    )
+    serve_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=0,
+        help="worker processes, 0 for all cores (default: 0)",
+    )
+
+    client_parser = subparsers.add_parser(
+        "client", help="send a solve request to the daemon"
+    )
+    client_parser.add_argument(
+        "day", type=int, choices=runner.DAYS, help="day number"
+    )
+    client_parser.add_argument(
+        "input",
+        nargs="?",
+        type=Path,
+        help="input path (default: the shipped input)",
+    )
+    client_parser.add_argument(
+        "--star",
+        type=int,
+        choices=range(1, len(runner.STARS) + 1),
+        help="star to solve (default: all)",
+    )
+    client_parser.add_argument(
+        "--socket",
+        type=Path,
+        default=daemon.SOCKET_PATH,
+        help="path of the socket",
+    )
+
+    watch_parser = subparsers.add_parser(
+        "watch", help="re-solve days when their inputs change"
+    )
+    watch_parser.add_argument(
+        "days",
+        nargs="?",
+        default="1-20",
+        help="days to watch (default: 1-20)",
+    )
+    watch_parser.add_argument(
+        "--interval",
+        type=float,
+        default=watch.DEFAULT_INTERVAL,
+        help="seconds between two polls of the inputs (default: "
+        "%(default)s)",
+    )
+
+    startup_parser = subparsers.add_parser(
+        "startup", help="measure the import time of days"
+    )
+    startup_parser.add_argument(
+        "days",
+        nargs="?",
+        default="1-20",
+        help="days to measure (default: 1-20)",
+    )
+    startup_parser.add_argument(
+        "--budget",
+        type=float,
+        default=startup.DEFAULT_BUDGET_MS,
+        help="maximum import time of a day in ms (default: %(default)s)",
+    )
+    startup_parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="measurements per day, the fastest is kept (default: 3)",
+    )
+
+    args = parser.parse_args()
+
+    match args.command:
+        case "run":
+            if args.hooks:
+                os.environ[hooks.HOOKS_ENV] = args.hooks
+            runner.main(
+                runner.parse_days(args.days),
+                args.report,
+                args.jobs,
+                args.split_stars,
+                args.cache_size * 2**20 if args.cache else None,
+                args.stream,
+                args.memory,
+                args.answer_cache,
+                args.vectorized,
+            )
+        case "bench":
+            bench.main(
+                runner.parse_days(args.days),
+                [float(scale) for scale in args.scales.split(",")],
+                args.repeat,
+                args.seed,
+                not args.no_memory,
+                args.threshold,
+                args.baseline,
+                args.save_baseline,
+            )
+        case "batch":
+            batch.main(args.day, args.inputs, args.jobs, args.output)
+        case "check":
+            check.main(
+                runner.parse_days(args.days),
+                args.jobs,
+                None if args.no_budget else args.budget_scale,
+                args.save,
+            )
+        case "chunked":
+            chunked.main(args.day, args.input, args.jobs, args.chunks)
+        case "profile":
+            profiling.main(args.day, args.output_dir)
+        case "serve":
+            daemon.main(args.socket, args.jobs)
+        case "client":
+            daemon.client_main(args.socket, args.day, args.star, args.input)
+        case "watch":
+            watch.main(runner.parse_days(args.days), args.interval)
+        case "startup":
+            startup.main(
+                runner.parse_days(args.days), args.budget, args.repeat
+            )
+        case "clear-cache":
+            if not args.parsed:
+                cache.AnswerCache().clear()
+            if not args.answers:
+                cache.ParsedCache().clear()
+        case "generate":
+            generators.main(
+                args.day, args.size, args.scale, args.seed, args.output
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Solve many inputs of a day in one warm process."""
+
+__author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
+__date__ = "2023"
+__license__ = "MIT"
+
+import csv
+import glob
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, TextIO
+
+from aoc.runner import STARS, STEPS, load_day, run_day
+
+
+def main(
+    day: int, patterns: list[str], jobs: int, output_path: Path | None
+) -> None:
+    """Solve the inputs of a day and write their answers and timings.
+
+    :param day: Day number
+    :param patterns: Input directories, files or glob patterns
+    :param jobs: Number of worker processes, all cores if 0
+    :param output_path: Path of the CSV or JSON output, by suffix,
+        standard output as CSV if None
+    """
+    paths = [path for pattern in patterns for path in find_inputs(pattern)]
+    reports = run_batch(day, paths, jobs)
+    errors = [report for report in reports if "error" in report]
+
+    if output_path is None:
+        write_csv(reports, sys.stdout)
+    else:
+        write_output(reports, output_path)
+
+    for report in errors:
+        print(f"{report['input']}: {report['error']}", file=sys.stderr)
+    if errors:
+        sys.exit(1)
+
+
+def find_inputs(pattern: str) -> list[Path]:
+    """Find input files.
+
+    :param pattern: Input directory, file or glob pattern
+    :return: Sorted input paths
+    """
+    if os.path.isdir(pattern):
+        paths = [path for path in Path(pattern).iterdir() if path.is_file()]
+    else:
+        paths = [Path(path) for path in glob.glob(pattern)]
+
+    if not paths:
+        raise ValueError(f"No input files match {pattern}")
+
+    return sorted(paths)
+
+
+def run_batch(day: int, paths: list[Path], jobs: int) -> list[dict[str, Any]]:
+    """Solve inputs of a day, optionally over a pool of worker processes.
+
+    :param day: Day number
+    :param paths: Input paths
+    :param jobs: Number of worker processes, all cores if 0
+    :return: Day report of every input, with an error for the inputs
+        that failed
+    """
+    jobs = jobs or os.cpu_count() or 1
+
+    if jobs == 1:
+        return [solve_input(day, path) for path in paths]
+
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=load_day, initargs=(day,)
+    ) as executor:
+        return list(executor.map(solve_input, [day] * len(paths), paths))
+
+
+def solve_input(day: int, path: Path) -> dict[str, Any]:
+    """Solve an input of a day, reporting any error instead of raising it.
+
+    :param day: Day number
+    :param path: Input path
+    :return: Day report, or input path and error message
+    """
+    try:
+        return run_day(day, path)
+    # pylint: disable-next=broad-exception-caught
+    except Exception as error:
+        return {
+            "day": day,
+            "input": str(path),
+            "error": f"{type(error).__name__}: {error}",
+        }
+
+
+def write_csv(reports: list[dict[str, Any]], output_file: TextIO) -> None:
+    """Write answers and wall-clock timings as CSV, one row per input.
+
+    Inputs that failed have empty answers and timings and an error.
+
+    :param reports: Day reports
+    :param output_file: Output file
+    """
+    writer = csv.writer(output_file)
+    writer.writerow(
+        ["input", *STARS, *(f"{step}_wall_ns" for step in STEPS), "error"]
+    )
+
+    for report in reports:
+        if "error" in report:
+            writer.writerow(
+                [report["input"], *[""] * (len(STARS) + len(STEPS))]
+                + [report["error"]]
+            )
+            continue
+
+        writer.writerow(
+            [
+                report["input"],
+                *(report["answers"][star] for star in STARS),
+                *(report["timings"][step]["wall_ns"] for step in STEPS),
+                "",
+            ]
+        )
+
+
+def write_output(reports: list[dict[str, Any]], output_path: Path) -> None:
+    """Write the reports as CSV or JSON, by suffix of the output path.
+
+    :param reports: Day reports
+    :param output_path: Path of the output
+    """
+    with open(output_path, "w", encoding="utf-8", newline="") as output_file:
+        if output_path.suffix == ".json":
+            json.dump(reports, output_file, indent=2)
+            output_file.write("\n")
+        else:
+            write_csv(reports, output_file)
@@ -0,0 +1,265 @@
+"""Benchmark day solutions over increasing synthetic input sizes."""
+
+__author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
+__date__ = "2023"
+__license__ = "MIT"
+
+import json
+import math
+import platform
+import subprocess
+import sys
+import tracemalloc
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from aoc.generators import generate, scaled_size
+from aoc.runner import STEPS, load_day, measure
+
+RESULTS_DIR = Path(__file__).resolve().parent.parent / "benchmarks"
+
+DEFAULT_SCALES = [0.25, 0.5, 1.0]
+
+# Timings shorter than this are too noisy to be compared
+MIN_COMPARED_NS = 1_000_000
+
+
+def main(
+    days: list[int],
+    scales: list[float],
+    repeat: int,
+    seed: int,
+    memory: bool,
+    threshold: float,
+    baseline_path: Path,
+    save_baseline: bool,
+) -> None:
+    """Benchmark days, store the results and compare them to a baseline.
+
+    :param days: Days to benchmark
+    :param scales: Data scale factors relative to the shipped inputs
+    :param repeat: Number of timed runs per size, the fastest is kept
+    :param seed: Random seed of the generated inputs
+    :param memory: If peak memory is measured
+    :param threshold: Maximum allowed slowdown in percent
+    :param baseline_path: Path of the baseline results
+    :param save_baseline: If the results become the new baseline
+    """
+    results: dict[str, Any] = {
+        "commit": get_commit(),
+        "python": platform.python_version(),
+        "scales": scales,
+        "seed": seed,
+        "days": {},
+    }
+
+    for day in days:
+        results["days"][str(day)] = bench_day(
+            day, scales, repeat, seed, memory
+        )
+        print_day(day, results["days"][str(day)])
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    write_results(results, RESULTS_DIR / f"{results['commit']}.json")
+
+    if save_baseline:
+        write_results(results, baseline_path)
+        return
+
+    if baseline_path.exists():
+        with open(baseline_path, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare(results, baseline, threshold)
+        for regression in regressions:
+            print(regression)
+        if regressions:
+            sys.exit(1)
+
+
+def bench_day(
+    day: int, scales: list[float], repeat: int, seed: int, memory: bool
+) -> dict[str, Any]:
+    """Benchmark a day over several input sizes.
+
+    :param day: Day number
+    :param scales: Data scale factors relative to the shipped input
+    :param repeat: Number of timed runs per size, the fastest is kept
+    :param seed: Random seed of the generated inputs
+    :param memory: If peak memory is measured
+    :return: Day results
+    """
+    module = load_day(day)
+    results: dict[str, Any] = {
+        "sizes": [],
+        "bytes": [],
+        **{step: {"wall_ns": [], "peak_bytes": []} for step in STEPS},
+    }
+
+    for scale in scales:
+        size = scaled_size(day, scale)
+        raw_input = generate(day, size, seed)
+        results["sizes"].append(size)
+        results["bytes"].append(len(raw_input))
+
+        best = dict.fromkeys(STEPS, math.inf)
+        for _ in range(repeat):
+            for step, wall_ns in run_steps(module, raw_input).items():
+                best[step] = min(best[step], wall_ns)
+
+        peaks: dict[str, int | None] = dict.fromkeys(STEPS)
+        if memory:
+            tracemalloc.start()
+            peaks.update(run_steps(module, raw_input, peak=True))
+            tracemalloc.stop()
+
+        for step in STEPS:
+            results[step]["wall_ns"].append(best[step])
+            results[step]["peak_bytes"].append(peaks[step])
+
+    for step in STEPS:
+        results[step]["exponent"] = fit_exponent(
+            results["bytes"], results[step]["wall_ns"]
+        )
+
+    return results
+
+
+def compare(
+    results: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """Compare results to a baseline.
+
+    :param results: Benchmark results
+    :param baseline: Baseline results
+    :param threshold: Maximum allowed slowdown in percent
+    :return: Description of every regression
+    """
+    regressions = []
+
+    for day, day_results in results["days"].items():
+        day_baseline = baseline["days"].get(day)
+        if day_baseline is None:
+            continue
+        for step in STEPS:
+            baseline_times = dict(
+                zip(baseline["scales"], day_baseline[step]["wall_ns"])
+            )
+            for scale, wall_ns in zip(
+                results["scales"], day_results[step]["wall_ns"]
+            ):
+                baseline_ns = baseline_times.get(scale)
+                if baseline_ns is None or baseline_ns < MIN_COMPARED_NS:
+                    continue
+                slowdown = 100 * (wall_ns / baseline_ns - 1)
+                if slowdown > threshold:
+                    regressions.append(
+                        f"Day {day} {step} at scale {scale}: "
+                        f"{slowdown:.1f}% slower than baseline "
+                        f"({baseline_ns / 1e6:.2f} ms -> "
+                        f"{wall_ns / 1e6:.2f} ms)"
+                    )
+
+    return regressions
+
+
+def fit_exponent(sizes: list[int], times: list[float]) -> float | None:
+    """Fit the empirical complexity exponent of times over sizes.
+
+    :param sizes: Input sizes
+    :param times: Times measured for each size
+    :return: Slope of the least squares line in log-log space, None if
+        it cannot be computed
+    """
+    points = [
+        (math.log(size), math.log(time))
+        for size, time in zip(sizes, times)
+        if time > 0
+    ]
+    if len(set(x for x, _ in points)) < 2:
+        return None
+
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+
+    return covariance / variance
+
+
+def get_commit() -> str:
+    """Get the abbreviated hash of the current commit.
+
+    :return: Commit hash, 'unknown' outside of a git repository
+    """
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+    return completed.stdout.strip()
+
+
+def print_day(day: int, results: dict[str, Any]) -> None:
+    """Print the results of a day.
+
+    :param day: Day number
+    :param results: Day results
+    """
+    print(f"Day {day}")
+    for i, size in enumerate(results["sizes"]):
+        timings = ", ".join(
+            f"{step} {results[step]['wall_ns'][i] / 1e6:.2f} ms"
+            for step in STEPS
+        )
+        print(f"  size {size} ({results['bytes'][i]} B): {timings}")
+    exponents = ", ".join(
+        f"{step} {results[step]['exponent']:.2f}"
+        for step in STEPS
+        if results[step]["exponent"] is not None
+    )
+    print(f"  exponents: {exponents}")
+
+
+def run_steps(
+    module: ModuleType, raw_input: str, peak: bool = False
+) -> dict[str, int]:
+    """Parse an input and solve both stars.
+
+    :param module: Day module
+    :param raw_input: Raw puzzle input
+    :param peak: If peak traced memory is returned instead of time
+    :return: Wall-clock time or peak memory of every step
+    """
+    measures = {}
+
+    puzzle_input = None
+    for step in STEPS:
+        if peak:
+            tracemalloc.reset_peak()
+        if step == "load":
+            puzzle_input, timing = measure(module.parse_input, raw_input)
+        else:
+            _, timing = measure(getattr(module, step), puzzle_input)
+        if peak:
+            measures[step] = tracemalloc.get_traced_memory()[1]
+        else:
+            measures[step] = timing["wall_ns"]
+
+    return measures
+
+
+def write_results(results: dict[str, Any], path: Path) -> None:
+    """Write benchmark results as JSON.
+
+    :param results: Benchmark results
+    :param path: Output path
+    """
+    with open(path, "w", encoding="utf-8") as results_file:
+        json.dump(results, results_file, indent=2)
+        results_file.write("\n")
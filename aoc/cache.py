@@ -0,0 +1,246 @@
+"""On-disk caches of parsed puzzle inputs and of answers."""
+
+__author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
+__date__ = "2023"
+__license__ = "MIT"
+
+import ast
+import hashlib
+import importlib.util
+import json
+import os
+import pickle
+import tempfile
+from functools import cache
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".aoc_cache"
+
+DEFAULT_MAX_BYTES = 256 * 2**20
+
+
+class AnswerCache:
+    """Cache of answers, keyed by day, star and content hash.
+
+    Answers are small, so every entry is kept until the cache is cleared.
+    As for parsed inputs, the key covers the source of the day module and
+    of the aoc modules it imports, so editing a solver invalidates its
+    answers.
+    """
+
+    def __init__(self, directory: Path = CACHE_DIR / "answers") -> None:
+        self.directory = directory
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        clear_directory(self.directory, "*.json")
+
+    def get(self, day: int, star: str, key: str) -> Any:
+        """Get a cached answer.
+
+        :param day: Day number
+        :param star: Star name
+        :param key: Cache key of the input
+        :return: Answer, None on a miss
+        """
+        try:
+            with open(
+                self.get_path(day, star, key), encoding="utf-8"
+            ) as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+
+    def get_path(self, day: int, star: str, key: str) -> Path:
+        """Get the path of an entry.
+
+        :param day: Day number
+        :param star: Star name
+        :param key: Cache key of the input
+        :return: Entry path
+        """
+        return self.directory / f"day_{day}-{star}-{key}.json"
+
+    def store(self, day: int, star: str, key: str, answer: Any) -> None:
+        """Atomically write an answer.
+
+        :param day: Day number
+        :param star: Star name
+        :param key: Cache key of the input
+        :param answer: Answer
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.directory, suffix=".tmp", delete=False
+        ) as temporary_file:
+            json.dump(answer, temporary_file)
+
+        os.replace(temporary_file.name, self.get_path(day, star, key))
+
+
+class ParsedCache:
+    """Size-bounded LRU cache of parsed inputs, keyed by content hash.
+
+    Entries are pickled under a hash of the raw input and of the sources of
+    the day module and of the aoc modules it imports, so editing a parser
+    invalidates its entries. Reading an entry refreshes its modification
+    time, and the least recently used entries are evicted once the
+    directory exceeds its size bound.
+    """
+
+    def __init__(
+        self,
+        directory: Path = CACHE_DIR / "parsed",
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        clear_directory(self.directory, "*.pickle")
+
+    def load(self, day: int, module: ModuleType, raw_input: str) -> Any:
+        """Get a parsed input, parsing and storing it on a miss.
+
+        :param day: Day number
+        :param module: Day module
+        :param raw_input: Raw puzzle input
+        :return: Puzzle input
+        """
+        path = (
+            self.directory / f"day_{day}-{get_key(module, raw_input)}.pickle"
+        )
+
+        try:
+            with open(path, "rb") as cache_file:
+                puzzle_input = pickle.load(cache_file)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+        else:
+            os.utime(path)
+            return puzzle_input
+
+        puzzle_input = module.parse_input(raw_input)
+        self.store(path, puzzle_input)
+        self.evict()
+
+        return puzzle_input
+
+    def store(self, path: Path, value: Any) -> None:
+        """Atomically write a cache entry.
+
+        :param path: Entry path
+        :param value: Value to pickle
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        with tempfile.NamedTemporaryFile(
+            dir=self.directory, suffix=".tmp", delete=False
+        ) as temporary_file:
+            pickle.dump(value, temporary_file, pickle.HIGHEST_PROTOCOL)
+
+        os.replace(temporary_file.name, path)
+
+    def evict(self) -> None:
+        """Remove least recently used entries beyond the size bound."""
+        entries = []
+        for path in self.directory.glob("*.pickle"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+def clear_directory(directory: Path, pattern: str) -> None:
+    """Remove the cache entries of a directory.
+
+    :param directory: Cache directory
+    :param pattern: Glob pattern of the entries
+    """
+    for path in directory.glob(pattern):
+        path.unlink(missing_ok=True)
+
+
+def get_key(module: ModuleType, raw_input: str) -> str:
+    """Get the cache key of an input.
+
+    :param module: Day module
+    :param raw_input: Raw puzzle input
+    :return: Hex digest of the module source and of the input
+    """
+    digest = hashlib.sha256(get_version(module).encode())
+    digest.update(raw_input.encode())
+
+    return digest.hexdigest()
+
+
+def get_sources(path: str) -> list[str]:
+    """Get the path of a source and of the aoc modules it imports.
+
+    Imports are found statically and followed through the imported aoc
+    modules, so lazily imported modules are not loaded.
+
+    :param path: Source path
+    :return: Source paths, starting from the given one
+    """
+    sources = [path]
+    pending = [path]
+
+    while pending:
+        source = pending.pop()
+        with open(source, "rb") as source_file:
+            tree = ast.parse(source_file.read(), source)
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and not node.level:
+                names = [node.module or ""]
+                names.extend(
+                    f"{node.module}.{alias.name}" for alias in node.names
+                )
+            else:
+                continue
+
+            for name in names:
+                if name.partition(".")[0] != "aoc":
+                    continue
+                try:
+                    spec = importlib.util.find_spec(name)
+                except ModuleNotFoundError:
+                    continue
+                if spec and spec.origin and spec.origin not in sources:
+                    sources.append(spec.origin)
+                    pending.append(spec.origin)
+
+    return sources
+
+
+@cache
+def get_version(module: ModuleType) -> str:
+    """Get the version of a day module from a hash of its sources.
+
+    :param module: Day module
+    :return: Hex digest of the sources of the module and of the aoc modules
+        it imports
+    """
+    digest = hashlib.sha256()
+
+    for path in get_sources(module.__file__ or ""):
+        with open(path, "rb") as source_file:
+            digest.update(source_file.read())
+
+    return digest.hexdigest()
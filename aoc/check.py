@@ -0,0 +1,227 @@
+"""Check answers and time budgets of the shipped inputs."""
+
+__author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
+__date__ = "2023"
+__license__ = "MIT"
+
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+from aoc.chunked import CHUNKED_DAYS, solve_chunked
+from aoc.runner import DATA_DIR, STARS, load_day, run_days
+
+ANSWERS_PATH = DATA_DIR / "answers.json"
+
+REGRESSIONS_PATH = DATA_DIR / "regressions.json"
+
+DEFAULT_BUDGET_S = 1.0
+
+
+def main(
+    days: list[int],
+    jobs: int,
+    budget_scale: float | None,
+    save: bool,
+    answers_path: Path = ANSWERS_PATH,
+) -> None:
+    """Run days and compare them to the expected answers and budgets.
+
+    The answers of the streaming and chunked modes are checked as well,
+    for the days supporting them, and so are the small regression inputs
+    of the days, against the answers stored in ``REGRESSIONS_PATH``.
+
+    :param days: Days to check
+    :param jobs: Number of worker processes, all cores if 0
+    :param budget_scale: Factor applied to every time budget, budgets are
+        not enforced if None
+    :param save: If the answers are stored as the expected ones instead
+    :param answers_path: Path of the expected answers
+    """
+    expected = read_answers(answers_path)
+    report = run_days(days, jobs=jobs)
+
+    if save:
+        for day_report in report["days"]:
+            day_expected = expected.setdefault(str(day_report["day"]), {})
+            for star in STARS:
+                day_expected.setdefault(star, {"budget_s": DEFAULT_BUDGET_S})
+                day_expected[star]["answer"] = day_report["answers"][star]
+        write_answers(expected, answers_path)
+        return
+
+    failures = []
+    for day_report in report["days"]:
+        failures.extend(
+            check_day(
+                day_report, expected.get(str(day_report["day"])), budget_scale
+            )
+        )
+    failures.extend(check_modes(days, jobs, expected))
+
+    regressions = read_answers(REGRESSIONS_PATH)
+    for day in days:
+        failures.extend(check_regressions(day, regressions.get(str(day), [])))
+
+    for failure in failures:
+        print(failure)
+
+    print(f"Checked {len(days)} days, {len(failures)} failures")
+    if failures:
+        sys.exit(1)
+
+
+def check_modes(
+    days: list[int], jobs: int, expected: dict[str, Any]
+) -> list[str]:
+    """Solve days in streaming and chunked modes and compare their answers.
+
+    Only the days providing ``solve_stream`` are streamed and only the
+    ``CHUNKED_DAYS`` are chunked, budgets being enforced on neither.
+
+    :param days: Days to check
+    :param jobs: Number of worker processes, all cores if 0
+    :param expected: Expected answer and time budget of each star of each
+        day
+    :return: Description of every failure
+    """
+    stream_days = [
+        day for day in days if hasattr(load_day(day), "solve_stream")
+    ]
+    reports = {
+        " (stream)": run_days(stream_days, jobs=jobs, stream=True)["days"],
+        " (chunked)": [
+            {
+                "day": day,
+                "answers": dict(zip(STARS, solve_chunked(day, jobs=jobs))),
+            }
+            for day in days
+            if day in CHUNKED_DAYS
+        ],
+    }
+
+    failures = []
+    for mode, day_reports in reports.items():
+        for day_report in day_reports:
+            failures.extend(
+                check_day(
+                    day_report,
+                    expected.get(str(day_report["day"])),
+                    None,
+                    mode,
+                )
+            )
+
+    return failures
+
+
+def check_day(
+    report: dict[str, Any],
+    expected: dict[str, Any] | None,
+    budget_scale: float | None,
+    mode: str = "",
+) -> list[str]:
+    """Compare a day report to its expected answers and budgets.
+
+    :param report: Day report
+    :param expected: Expected answer and time budget of each star
+    :param budget_scale: Factor applied to every time budget, budgets are
+        not enforced if None
+    :param mode: Suffix of the star in failures, naming the solving mode
+    :return: Description of every failure
+    """
+    day = report["day"]
+    if expected is None:
+        return [f"Day {day}{mode}: no expected answers"]
+
+    failures = []
+    for i, star in enumerate(STARS, start=1):
+        answer = report["answers"][star]
+        if answer != expected[star]["answer"]:
+            failures.append(
+                f"Day {day} star {i}{mode}: got {answer}, "
+                f"expected {expected[star]['answer']}"
+            )
+
+        if budget_scale is None:
+            continue
+        elapsed_s = report["timings"][star]["wall_ns"] / 1e9
+        budget_s = expected[star]["budget_s"] * budget_scale
+        if elapsed_s > budget_s:
+            failures.append(
+                f"Day {day} star {i}: took {elapsed_s:.2f} s, "
+                f"budget {budget_s:.2f} s"
+            )
+
+    return failures
+
+
+def check_regressions(day: int, cases: list[dict[str, Any]]) -> list[str]:
+    """Solve the regression inputs of a day and compare their answers.
+
+    Days providing ``solve_stream`` also solve the inputs expecting both
+    stars in one pass, so that both code paths are checked.
+
+    :param day: Day number
+    :param cases: Name, raw input and expected answer of some stars of
+        each regression input
+    :return: Description of every failure
+    """
+    module = load_day(day)
+
+    failures = []
+    for case in cases:
+        puzzle_input = module.parse_input(case["input"])
+        solutions = {
+            "": {
+                star: getattr(module, star)(puzzle_input)
+                for star in STARS
+                if star in case
+            }
+        }
+        if hasattr(module, "solve_stream") and all(
+            star in case for star in STARS
+        ):
+            lines = case["input"].splitlines(keepends=True)
+            solutions[" (stream)"] = dict(
+                zip(STARS, module.solve_stream(lines))
+            )
+        for mode, answers in solutions.items():
+            for i, star in enumerate(STARS, start=1):
+                if star in answers and answers[star] != case[star]:
+                    failures.append(
+                        f"Day {day} star {i}{mode} on {case['name']}: got "
+                        f"{answers[star]}, expected {case[star]}"
+                    )
+
+    return failures
+
+
+def read_answers(answers_path: Path) -> dict[str, Any]:
+    """Read the expected answers.
+
+    :param answers_path: Path of the expected answers
+    :return: Expected answer and time budget of each star of each day
+    """
+    if not answers_path.exists():
+        return {}
+
+    with open(answers_path, encoding="utf-8") as answers_file:
+        return json.load(answers_file)
+
+
+def write_answers(expected: dict[str, Any], answers_path: Path) -> None:
+    """Write the expected answers, sorted by day.
+
+    :param expected: Expected answer and time budget of each star of each
+        day
+    :param answers_path: Path of the expected answers
+    """
+    with open(answers_path, "w", encoding="utf-8") as answers_file:
+        json.dump(
+            dict(sorted(expected.items(), key=lambda item: int(item[0]))),
+            answers_file,
+            indent=2,
+        )
+        answers_file.write("\n")
@@ -0,0 +1,187 @@
+"""Solve line-independent days over chunks of the input in parallel."""
+
+__author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
+__date__ = "2023"
+__license__ = "MIT"
+
+import mmap
+import operator
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from aoc.runner import STARS, get_input_path, load_day
+
+CHUNKED_DAYS = [1, 2, 4, 9, 12]
+
+# Chunks per worker, so that uneven chunks are balanced across workers
+CHUNKS_PER_JOB = 4
+
+
+def main(
+    day: int, input_path: Path | None, jobs: int, chunks: int | None
+) -> None:
+    """Solve a day over chunks of its input and print the answers.
+
+    :param day: Day number
+    :param input_path: Input path, the shipped input if None
+    :param jobs: Number of worker processes, all cores if 0
+    :param chunks: Number of chunks, a few per worker if None
+    """
+    start = time.perf_counter_ns()
+    solutions = solve_chunked(day, input_path, jobs, chunks)
+    elapsed_ns = time.perf_counter_ns() - start
+
+    print(f"Day {day}")
+    for i, solution in enumerate(solutions, start=1):
+        print(f"Star {i}: {solution}")
+    print(f"Elapsed {elapsed_ns / 1e9:.2f} s")
+
+
+def read_range(path: Path, start: int, end: int) -> Iterator[str]:
+    """Lazily read the lines within a byte range of a file.
+
+    :param path: Input path
+    :param start: Offset of the first line
+    :param end: Offset past the last line
+    :return: Generator of input lines
+    """
+    with open(path, "rb") as input_file, mmap.mmap(
+        input_file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as buffer:
+        buffer.seek(start)
+        while buffer.tell() < end:
+            yield buffer.readline().decode("ascii")
+
+
+def solve_chunked(
+    day: int,
+    input_path: Path | None = None,
+    jobs: int = 0,
+    chunks: int | None = None,
+) -> tuple[int, ...]:
+    """Solve a day over chunks of its input.
+
+    Workers solve their chunk with ``solve_chunk``, or ``solve_stream``
+    when the day has no chunk-specific solver.
+
+    :param day: Day number
+    :param input_path: Input path, the shipped input if None
+    :param jobs: Number of worker processes, all cores if 0
+    :param chunks: Number of chunks, a few per worker if None
+    :return: Solutions of both puzzles
+    """
+    if day not in CHUNKED_DAYS:
+        raise ValueError(f"Day {day} cannot be solved in chunks")
+
+    path = input_path or get_input_path(day)
+    jobs = jobs or os.cpu_count() or 1
+    ranges = split_ranges(path, chunks or jobs * CHUNKS_PER_JOB)
+
+    if jobs == 1:
+        partials = [solve_range(day, path, *bounds) for bounds in ranges]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            partials = list(
+                executor.map(
+                    solve_range,
+                    [day] * len(ranges),
+                    [path] * len(ranges),
+                    *zip(*ranges),
+                )
+            )
+
+    return reduce_partials(day, partials)
+
+
+def reduce_partials(day: int, partials: list[Any]) -> tuple[int, ...]:
+    """Combine the partial results of consecutive chunks.
+
+    :param day: Day number
+    :param partials: Partial results, in input order
+    :return: Solutions of both puzzles
+    """
+    module = load_day(day)
+    if hasattr(module, "reduce_chunks"):
+        return module.reduce_chunks(partials)
+
+    return tuple(
+        sum(partial[i] for partial in partials) for i in range(len(STARS))
+    )
+
+
+def fold_partial(day: int, state: Any, partial: Any) -> Any:
+    """Fold the partial result of the next chunk into a running state.
+
+    Days providing ``fold_chunk`` keep their own state, whose first items
+    are the solutions so far, while the others sum the partial results
+    star by star.
+
+    :param day: Day number
+    :param state: Running state of the previous chunks, None if none
+    :param partial: Partial result of the next chunk
+    :return: Running state including the chunk
+    """
+    module = load_day(day)
+    if hasattr(module, "fold_chunk"):
+        return module.fold_chunk(state, partial)
+    if state is None:
+        return tuple(partial)
+
+    return tuple(map(operator.add, state, partial))
+
+
+def solve_lines(day: int, lines: Iterable[str]) -> Any:
+    """Solve consecutive lines of an input.
+
+    :param day: Day number
+    :param lines: Input lines
+    :return: Partial result of the lines, combined by ``reduce_chunks``
+        or summed star by star
+    """
+    module = load_day(day)
+    solve = getattr(module, "solve_chunk", module.solve_stream)
+
+    return solve(lines)
+
+
+def solve_range(day: int, path: Path, start: int, end: int) -> Any:
+    """Solve the lines within a byte range of an input.
+
+    :param day: Day number
+    :param path: Input path
+    :param start: Offset of the first line
+    :param end: Offset past the last line
+    :return: Partial result of the chunk, combined by ``reduce_chunks``
+        or summed star by star
+    """
+    return solve_lines(day, read_range(path, start, end))
+
+
+def split_ranges(path: Path, chunks: int) -> list[tuple[int, int]]:
+    """Split a file at line boundaries into byte ranges of similar size.
+
+    :param path: Input path
+    :param chunks: Number of ranges
+    :return: Start and end offset of every non-empty range
+    """
+    size = path.stat().st_size
+    if not size:
+        return []
+
+    bounds = [0]
+    with open(path, "rb") as input_file, mmap.mmap(
+        input_file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as buffer:
+        for i in range(1, chunks):
+            newline = buffer.find(b"\n", max(size * i // chunks, bounds[-1]))
+            if newline < 0:
+                break
+            bounds.append(newline + 1)
+    bounds.append(size)
+
+    return [
+        (start, end) for start, end in zip(bounds, bounds[1:]) if start < end
+    ]
@@ -0,0 +1,203 @@
+"""Warm solver daemon serving requests over a Unix domain socket."""
+
+__author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
+__date__ = "2023"
+__license__ = "MIT"
+
+import importlib
+import json
+import os
+import signal
+import socket
+import socketserver
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from aoc.cache import CACHE_DIR
+from aoc.runner import (
+    DAYS,
+    STARS,
+    get_input_path,
+    load_day,
+    measure,
+    read_input,
+)
+
+SOCKET_PATH = CACHE_DIR / "daemon.sock"
+
+# Heavy modules imported by the workers before any request
+PRELOADED_MODULES = ["numpy"]
+
+
+class SolverServer(socketserver.ThreadingUnixStreamServer):
+    """Threaded server dispatching requests to a pool of warm workers."""
+
+    daemon_threads = True
+
+    def __init__(
+        self, socket_path: Path, executor: ProcessPoolExecutor
+    ) -> None:
+        super().__init__(str(socket_path), RequestHandler)
+        self.executor = executor
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """Handler of newline-delimited JSON requests."""
+
+    server: SolverServer
+
+    def handle(self) -> None:
+        """Answer every request of the connection in order."""
+        for line in self.rfile:
+            try:
+                day, stars, raw_input = parse_request(json.loads(line))
+                response = self.server.executor.submit(
+                    solve, day, stars, raw_input
+                ).result()
+            # pylint: disable-next=broad-exception-caught
+            except Exception as error:
+                response = {"error": f"{type(error).__name__}: {error}"}
+
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+def main(socket_path: Path, jobs: int) -> None:
+    """Serve requests until interrupted.
+
+    :param socket_path: Path of the Unix domain socket
+    :param jobs: Number of worker processes, all cores if 0
+    """
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    socket_path.unlink(missing_ok=True)
+
+    # Shut down cleanly on termination as on interruption
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    jobs = jobs or os.cpu_count() or 1
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=preload
+    ) as executor, SolverServer(socket_path, executor) as server:
+        # Start every worker now rather than on the first requests
+        for future in [executor.submit(os.getpid) for _ in range(jobs)]:
+            future.result()
+        print(f"Serving on {socket_path} with {jobs} workers")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+
+def client_main(
+    socket_path: Path, day: int, star: int | None, input_path: Path | None
+) -> None:
+    """Send a request to the daemon and print the answers.
+
+    :param socket_path: Path of the Unix domain socket
+    :param day: Day number
+    :param star: Star number, both if None
+    :param input_path: Input path, the shipped input if None
+    """
+    raw_input = read_input(input_path or get_input_path(day))
+
+    response = request(socket_path, day, star, raw_input)
+    if "error" in response:
+        raise SystemExit(response["error"])
+
+    print(f"Day {day}")
+    for star_name, answer in response["answers"].items():
+        print(f"Star {STARS.index(star_name) + 1}: {answer}")
+
+
+def is_integer(value: Any) -> bool:
+    """Check that a decoded JSON value is an integer.
+
+    Booleans and integral floats compare equal to integers, so they are
+    rejected explicitly.
+
+    :param value: Decoded value
+    :return: If the value is an integer
+    """
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def parse_request(message: Any) -> tuple[int, list[str], str]:
+    """Validate a request.
+
+    :param message: Decoded request, with day, optional star and input
+    :return: Day number, stars to solve and raw puzzle input
+    """
+    if not isinstance(message, dict):
+        raise ValueError("Invalid request")
+
+    day = message.get("day")
+    if not is_integer(day) or day not in DAYS:
+        raise ValueError(f"Invalid day: {day}")
+
+    star = message.get("star")
+    if star is None:
+        stars = STARS
+    elif is_integer(star) and star in range(1, len(STARS) + 1):
+        stars = [STARS[star - 1]]
+    else:
+        raise ValueError(f"Invalid star: {star}")
+
+    raw_input = message.get("input")
+    if not isinstance(raw_input, str):
+        raise ValueError("Invalid input")
+
+    return day, stars, raw_input
+
+
+def preload() -> None:
+    """Import heavy modules and every day module in a worker."""
+    for name in PRELOADED_MODULES:
+        importlib.import_module(name)
+
+    for day in DAYS:
+        load_day(day)
+
+
+def request(
+    socket_path: Path, day: int, star: int | None, raw_input: str
+) -> dict[str, Any]:
+    """Send a request to the daemon.
+
+    :param socket_path: Path of the Unix domain socket
+    :param day: Day number
+    :param star: Star number, both if None
+    :param raw_input: Raw puzzle input
+    :return: Decoded response
+    """
+    message = {"day": day, "star": star, "input": raw_input}
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(str(socket_path))
+        with connection.makefile("rwb") as stream:
+            stream.write(json.dumps(message).encode() + b"\n")
+            stream.flush()
+            return json.loads(stream.readline())
+
+
+def solve(day: int, stars: list[str], raw_input: str) -> dict[str, Any]:
+    """Parse an input and solve stars of a day, timing each step.
+
+    :param day: Day number
+    :param stars: Stars to solve
+    :param raw_input: Raw puzzle input
+    :return: Answers and timings
+    """
+    module = load_day(day)
+
+    answers = {}
+    timings = {}
+
+    puzzle_input, timings["load"] = measure(module.parse_input, raw_input)
+    for star in stars:
+        answers[star], timings[star] = measure(
+            getattr(module, star), puzzle_input
+        )
+
+    return {"day": day, "answers": answers, "timings": timings}
@@ -0,0 +1,801 @@
+"""Seeded synthetic input generators for every day."""
+
+__author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
+__date__ = "2023"
+__license__ = "MIT"
+
+import string
+from collections import deque
+from itertools import count, product
+from random import Random
+from typing import Callable, Iterator
+
+# Size of the shipped inputs and number of dimensions the size spans
+SIZES = {
+    1: (1000, 1),  # lines
+    2: (100, 1),  # games
+    3: (140, 2),  # grid side
+    4: (220, 1),  # cards
+    5: (33, 1),  # entries per map
+    6: (4, 1),  # races
+    7: (1000, 1),  # hands
+    8: (700, 1),  # nodes
+    9: (200, 1),  # sequences
+    10: (140, 2),  # grid side
+    11: (140, 2),  # grid side
+    12: (1000, 1),  # lines
+    13: (100, 1),  # patterns
+    14: (100, 2),  # grid side
+    15: (4000, 1),  # steps
+    16: (110, 2),  # grid side
+    17: (141, 2),  # grid side
+    18: (666, 1),  # instructions
+    19: (520, 1),  # workflows
+    20: (4, 1),  # counter chains
+}
+
+DIGIT_NAMES = [
+    "one",
+    "two",
+    "three",
+    "four",
+    "five",
+    "six",
+    "seven",
+    "eight",
+    "nine",
+]
+
+CARDS = "AKQJT98765432"
+
+MATCH_WEIGHTS = [60, 20, 8, 4, 3, 2, 1, 1, 0.5, 0.3, 0.2]
+
+CATEGORIES = "xmas"
+
+MAX_RATING = 4000
+
+MAX_HEX_DISTANCE = 0xFFFFF
+
+COUNTER_BITS = 12
+
+
+def main(
+    day: int,
+    size: int | None,
+    scale: float,
+    seed: int,
+    output_path: str | None,
+) -> None:
+    """Generate an input and write it to a file or standard output.
+
+    :param day: Day number
+    :param size: Input size, derived from scale if None
+    :param scale: Data scale factor relative to the shipped input
+    :param seed: Random seed
+    :param output_path: Output path, standard output if None
+    """
+    raw_input = generate(day, size or scaled_size(day, scale), seed)
+
+    if output_path is None:
+        print(raw_input, end="")
+    else:
+        with open(output_path, "w", encoding="ascii") as output_file:
+            output_file.write(raw_input)
+
+
+def generate(day: int, size: int, seed: int = 0) -> str:
+    """Generate a valid puzzle input.
+
+    :param day: Day number
+    :param size: Input size, see SIZES for its meaning
+    :param seed: Random seed
+    :return: Raw puzzle input
+    """
+    if size < 1:
+        raise ValueError(f"Invalid size: {size}")
+
+    lines = GENERATORS[day](size, Random(seed))
+
+    return "\n".join(lines) + "\n"
+
+
+def scaled_size(day: int, scale: float) -> int:
+    """Get the size yielding a given amount of data.
+
+    :param day: Day number
+    :param scale: Data scale factor relative to the shipped input
+    :return: Input size
+    """
+    base_size, dimensions = SIZES[day]
+
+    return max(1, round(base_size * scale ** (1 / dimensions)))
+
+
+def generate_day_1(size: int, rng: Random) -> list[str]:
+    """Generate calibration document lines.
+
+    :param size: Number of lines
+    :param rng: Random generator
+    :return: Input lines
+    """
+    lines = []
+
+    for _ in range(size):
+        tokens = [str(rng.randint(1, 9))]
+        for _ in range(rng.randint(1, 7)):
+            choice = rng.random()
+            if choice < 0.25:
+                tokens.append(str(rng.randint(1, 9)))
+            elif choice < 0.5:
+                tokens.append(rng.choice(DIGIT_NAMES))
+            else:
+                tokens.append(random_word(rng, 1, 5))
+        rng.shuffle(tokens)
+        lines.append("".join(tokens))
+
+    return lines
+
+
+def generate_day_2(size: int, rng: Random) -> list[str]:
+    """Generate game records.
+
+    :param size: Number of games
+    :param rng: Random generator
+    :return: Input lines
+    """
+    lines = []
+
+    for game_id in range(1, size + 1):
+        subsets = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            subsets.append(
+                ", ".join(f"{rng.randint(1, 20)} {color}" for color in colors)
+            )
+        lines.append(f"Game {game_id}: " + "; ".join(subsets))
+
+    return lines
+
+
+def generate_day_3(size: int, rng: Random) -> list[str]:
+    """Generate an engine schematic.
+
+    :param size: Grid side
+    :param rng: Random generator
+    :return: Input lines
+    """
+    lines = []
+
+    for _ in range(size):
+        line = ""
+        while len(line) < size:
+            choice = rng.random()
+            if choice < 0.1 and len(line) + 4 <= size:
+                line += str(rng.randint(1, 999)) + "."
+            elif choice < 0.15:
+                line += rng.choice("*#+$/@%=&-")
+            else:
+                line += "."
+        lines.append(line)
+
+    return lines
+
+
+def generate_day_4(size: int, rng: Random) -> list[str]:
+    """Generate scratchcards.
+
+    The number of matches never makes a card win copies past the last one,
+    and averages below one so the number of copies does not explode.
+
+    :param size: Number of cards
+    :param rng: Random generator
+    :return: Input lines
+    """
+    lines = []
+    width = len(str(size))
+
+    for card in range(1, size + 1):
+        matches = min(
+            rng.choices(range(11), weights=MATCH_WEIGHTS)[0], size - card
+        )
+        numbers = rng.sample(range(1, 100), 35 - matches)
+        winning = numbers[:10]
+        mine = winning[:matches] + numbers[10:]
+        rng.shuffle(mine)
+        lines.append(
+            f"Card {card:>{width}}: "
+            + " ".join(f"{number:>2}" for number in winning)
+            + " | "
+            + " ".join(f"{number:>2}" for number in mine)
+        )
+
+    return lines
+
+
+def generate_day_5(size: int, rng: Random) -> list[str]:
+    """Generate an almanac.
+
+    Each map is a bijection between disjoint source and destination
+    segments of the 32-bit range.
+
+    :param size: Number of entries per map
+    :param rng: Random generator
+    :return: Input lines
+    """
+    limit = 2**32
+    seeds = []
+    for _ in range(max(1, size // 3)):
+        start = rng.randrange(limit // 2)
+        seeds.extend([start, rng.randrange(1, limit // 16)])
+
+    lines = ["seeds: " + " ".join(map(str, seeds))]
+
+    steps = [
+        "seed-to-soil",
+        "soil-to-fertilizer",
+        "fertilizer-to-water",
+        "water-to-light",
+        "light-to-temperature",
+        "temperature-to-humidity",
+        "humidity-to-location",
+    ]
+
+    for step in steps:
+        cuts = sorted(rng.sample(range(1, limit), size))
+        segments = list(zip([0] + cuts, cuts + [limit]))
+        rng.shuffle(segments)
+        lines.extend(["", f"{step} map:"])
+        destination = rng.randrange(
+            limit - sum(end - start for start, end in segments[:size])
+        )
+        for source, end in segments[:size]:
+            lines.append(f"{destination} {source} {end - source}")
+            destination += end - source
+
+    return lines
+
+
+def generate_day_6(size: int, rng: Random) -> list[str]:
+    """Generate race records.
+
+    :param size: Number of races
+    :param rng: Random generator
+    :return: Input lines
+    """
+    times = [rng.randint(40, 99) for _ in range(size)]
+    distances = [rng.randint(100, min(999, t * t // 4 - 1)) for t in times]
+
+    return [
+        "Time:    " + "".join(f"{time:>7}" for time in times),
+        "Distance:" + "".join(f"{distance:>7}" for distance in distances),
+    ]
+
+
+def generate_day_7(size: int, rng: Random) -> list[str]:
+    """Generate distinct hands with their bids.
+
+    :param size: Number of hands
+    :param rng: Random generator
+    :return: Input lines
+    """
+    if size > len(CARDS) ** 5:
+        raise ValueError(f"Invalid size: {size}")
+
+    hands: set[str] = set()
+    while len(hands) < size:
+        hands.add("".join(rng.choices(CARDS, k=5)))
+
+    return [f"{hand} {rng.randint(1, 1000)}" for hand in sorted(hands)]
+
+
+def generate_day_8(size: int, rng: Random) -> list[str]:
+    """Generate a network of layered ghost paths.
+
+    Every path starts at a node ending in 'A', only visits nodes not
+    ending in 'A' or 'Z', reaches its node ending in 'Z' after a fixed
+    number of steps and then loops back to its first layer.
+
+    :param size: Number of nodes
+    :param rng: Random generator
+    :return: Input lines
+    """
+    letters = string.ascii_uppercase
+    middles = [
+        "".join(name) for name in product(letters, letters, letters[1:-1])
+    ]
+    if size > len(middles):
+        raise ValueError(f"Invalid size: {size}")
+
+    n_paths = max(1, min(6, size // 8))
+    rng.shuffle(middles)
+    prefixes = ["".join(name) for name in product(letters, repeat=2)]
+    starts = ["AAA"] + [
+        prefix + "A" for prefix in rng.sample(prefixes[1:], n_paths - 1)
+    ]
+    ends = ["ZZZ"] + [
+        prefix + "Z" for prefix in rng.sample(prefixes[:-1], n_paths - 1)
+    ]
+
+    nodes = []
+    available = iter(middles)
+    per_path = max(1, (size - 2 * n_paths) // n_paths)
+
+    for start, end in zip(starts, ends):
+        layers = [[start]]
+        for _ in range(max(1, per_path // 2)):
+            layers.append([next(available), next(available)])
+        layers.append([end])
+        for i, layer in enumerate(layers):
+            following = layers[i + 1] if i + 1 < len(layers) else layers[1]
+            for node in layer:
+                left, right = rng.choice(following), rng.choice(following)
+                nodes.append(f"{node} = ({left}, {right})")
+
+    rng.shuffle(nodes)
+    instructions = "".join(rng.choices("LR", k=rng.randint(200, 300)))
+
+    return [instructions, ""] + nodes
+
+
+def generate_day_9(size: int, rng: Random) -> list[str]:
+    """Generate polynomial sequences.
+
+    :param size: Number of sequences
+    :param rng: Random generator
+    :return: Input lines
+    """
+    lines = []
+
+    for _ in range(size):
+        differences = [rng.randint(-9, 9) for _ in range(rng.randint(1, 8))]
+        sequence = []
+        for _ in range(21):
+            sequence.append(differences[0])
+            for i in range(len(differences) - 1):
+                differences[i] += differences[i + 1]
+        lines.append(" ".join(map(str, sequence)))
+
+    return lines
+
+
+def generate_day_10(size: int, rng: Random) -> list[str]:
+    """Generate a pipe maze with a single loop.
+
+    The loop follows a random skyline, with the starting position on its
+    left edge, and every other tile is random.
+
+    :param size: Grid side
+    :param rng: Random generator
+    :return: Input lines
+    """
+    size = max(size, 5)
+    bottom = size - 2
+
+    tops = [rng.randint(1, bottom - 2)]
+    for _ in range(size - 4):
+        tops.append(min(max(tops[-1] + rng.randint(-3, 3), 1), bottom - 1))
+    tops.append(tops[-1])
+
+    path = [(1, y) for y in range(bottom, tops[0] - 1, -1)]
+    for x, top in enumerate(tops[1:], start=2):
+        y = path[-1][1]
+        path.append((x, y))
+        step = 1 if top > y else -1
+        path.extend((x, j) for j in range(y + step, top + step, step))
+    path.extend((size - 2, y) for y in range(tops[-1] + 1, bottom + 1))
+    path.extend((x, bottom) for x in range(size - 3, 1, -1))
+
+    grid = [rng.choices("|-LJ7F.", k=size) for _ in range(size)]
+
+    for i, (x, y) in enumerate(path):
+        x_p, y_p = path[i - 1]
+        x_n, y_n = path[(i + 1) % len(path)]
+        grid[y][x] = pipe(x_p - x, y_p - y, x_n - x, y_n - y)
+    grid[tops[0] + 1][1] = "S"
+
+    return ["".join(row) for row in grid]
+
+
+def generate_day_11(size: int, rng: Random) -> list[str]:
+    """Generate a galaxy image.
+
+    :param size: Grid side
+    :param rng: Random generator
+    :return: Input lines
+    """
+    lines = []
+
+    for _ in range(size):
+        row = ["#" if rng.random() < 0.022 else "." for _ in range(size)]
+        lines.append("".join(row))
+
+    if "#" not in "".join(lines):
+        lines[0] = "#" + lines[0][1:]
+
+    return lines
+
+
+def generate_day_12(size: int, rng: Random) -> list[str]:
+    """Generate damaged spring records.
+
+    :param size: Number of records
+    :param rng: Random generator
+    :return: Input lines
+    """
+    lines = []
+
+    for _ in range(size):
+        springs = "".join(rng.choices(".#", k=rng.randint(5, 20)))
+        if "#" not in springs:
+            springs = "#" + springs[1:]
+        damaged = [len(group) for group in springs.split(".") if group]
+        masked = "".join(
+            "?" if rng.random() < 0.5 else spring for spring in springs
+        )
+        lines.append(f"{masked} {','.join(map(str, damaged))}")
+
+    return lines
+
+
+def generate_day_13(size: int, rng: Random) -> list[str]:
+    """Generate mirror patterns.
+
+    Every pattern has a perfect vertical mirror and a horizontal mirror
+    with exactly one smudge, and no perfect horizontal mirror.
+
+    :param size: Number of patterns
+    :param rng: Random generator
+    :return: Input lines
+    """
+    lines: list[str] = []
+
+    for _ in range(size):
+        if lines:
+            lines.append("")
+        lines.extend(mirror_pattern(rng))
+
+    return lines
+
+
+def generate_day_14(size: int, rng: Random) -> list[str]:
+    """Generate a platform with rounded and cube-shaped rocks.
+
+    :param size: Grid side
+    :param rng: Random generator
+    :return: Input lines
+    """
+    return [
+        "".join(rng.choices(".O#", weights=[70, 20, 10], k=size))
+        for _ in range(size)
+    ]
+
+
+def generate_day_15(size: int, rng: Random) -> list[str]:
+    """Generate an initialization sequence.
+
+    :param size: Number of steps
+    :param rng: Random generator
+    :return: Input lines
+    """
+    labels = [random_word(rng, 2, 6) for _ in range(max(1, size // 4))]
+    steps = []
+
+    for _ in range(size):
+        label = rng.choice(labels)
+        if rng.random() < 0.6:
+            steps.append(f"{label}={rng.randint(1, 9)}")
+        else:
+            steps.append(f"{label}-")
+
+    return [",".join(steps)]
+
+
+def generate_day_16(size: int, rng: Random) -> list[str]:
+    """Generate a contraption layout.
+
+    :param size: Grid side
+    :param rng: Random generator
+    :return: Input lines
+    """
+    return [
+        "".join(rng.choices(".|-/\\", weights=[90, 3, 3, 2, 2], k=size))
+        for _ in range(size)
+    ]
+
+
+def generate_day_17(size: int, rng: Random) -> list[str]:
+    """Generate a heat loss map.
+
+    The ultra crucible moves at least four blocks before stopping, so
+    smaller grids have no path to the end.
+
+    :param size: Grid side
+    :param rng: Random generator
+    :return: Input lines
+    """
+    if size < 5:
+        raise ValueError(f"Invalid size: {size}")
+
+    return ["".join(rng.choices("123456789", k=size)) for _ in range(size)]
+
+
+def generate_day_18(size: int, rng: Random) -> list[str]:
+    """Generate a dig plan.
+
+    Both the plain and the hexadecimal instructions describe a skyline
+    with distinct consecutive heights, so the trench never touches
+    itself.
+
+    :param size: Approximate number of instructions
+    :param rng: Random generator
+    :return: Input lines
+    """
+    columns = max(2, (size - 2) // 2)
+    max_width = MAX_HEX_DISTANCE // columns
+
+    if max_width < 2:
+        raise ValueError(f"Invalid size: {size}")
+
+    plain = skyline(rng, columns, 10, 10)
+    hexadecimal = skyline(
+        rng, columns, min(max_width, 20000), MAX_HEX_DISTANCE - 1
+    )
+    codes = {"R": 0, "D": 1, "L": 2, "U": 3}
+
+    return [
+        f"{direction} {distance} (#{hex_distance:05x}{codes[hex_direction]})"
+        for (direction, distance), (hex_direction, hex_distance) in zip(
+            plain, hexadecimal
+        )
+    ]
+
+
+def generate_day_19(size: int, rng: Random) -> list[str]:
+    """Generate a tree of workflows and a list of parts.
+
+    Every rule splits the ratings reaching it into two non-empty ranges.
+
+    :param size: Number of workflows
+    :param rng: Random generator
+    :return: Input lines
+    """
+    names = unique_names(rng, exclude={"in"})
+    full_range = (1, MAX_RATING)
+    queue = deque([("in", {category: full_range for category in CATEGORIES})])
+    workflows = []
+    n_workflows = 1
+
+    while queue:
+        name, ranges = queue.popleft()
+        rules = []
+        for _ in range(rng.randint(1, 3)):
+            splittable = [c for c in CATEGORIES if ranges[c][0] < ranges[c][1]]
+            if not splittable:
+                break
+            category = rng.choice(splittable)
+            low, high = ranges[category]
+            if rng.random() < 0.5:
+                value = rng.randint(low + 1, high)
+                condition = (low, value - 1)
+                ranges = ranges | {category: (value, high)}
+                operator = "<"
+            else:
+                value = rng.randint(low, high - 1)
+                condition = (value + 1, high)
+                ranges = ranges | {category: (low, value)}
+                operator = ">"
+            target = rng.choice("AR")
+            if n_workflows < size and rng.random() < 0.8:
+                target = next(names)
+                queue.append((target, ranges | {category: condition}))
+                n_workflows += 1
+            rules.append(f"{category}{operator}{value}:{target}")
+        fallback = rng.choice("AR")
+        if n_workflows < size:
+            fallback = next(names)
+            queue.append((fallback, ranges))
+            n_workflows += 1
+        rules.append(fallback)
+        workflows.append(f"{name}{{{','.join(rules)}}}")
+
+    rng.shuffle(workflows)
+
+    parts = []
+    for _ in range(max(1, size * 200 // 520)):
+        ratings = [rng.randint(1, MAX_RATING) for _ in CATEGORIES]
+        parts.append(
+            "{"
+            + ",".join(f"{c}={r}" for c, r in zip(CATEGORIES, ratings))
+            + "}"
+        )
+
+    return workflows + [""] + parts
+
+
+def generate_day_20(size: int, rng: Random) -> list[str]:
+    """Generate a module configuration of binary counters.
+
+    Each counter is a chain of flip-flops driven by the broadcaster and
+    reset by a conjunction hub once it reaches a random odd period; every
+    hub feeds an inverter, and all inverters feed the conjunction in front
+    of 'rx'.
+
+    :param size: Number of counters
+    :param rng: Random generator
+    :return: Input lines
+    """
+    names = unique_names(rng, exclude={"rx"})
+    final = next(names)
+    outputs: dict[str, list[str]] = {"broadcaster": [], f"&{final}": ["rx"]}
+
+    for _ in range(size):
+        period = rng.randrange(2 ** (COUNTER_BITS - 1) + 1, 2**COUNTER_BITS, 2)
+        flip_flops = [next(names) for _ in range(COUNTER_BITS)]
+        hub = next(names)
+        inverter = next(names)
+        outputs["broadcaster"].append(flip_flops[0])
+        outputs[f"&{hub}"] = [inverter, flip_flops[0]]
+        outputs[f"&{inverter}"] = [final]
+        for bit, flip_flop in enumerate(flip_flops):
+            outputs[f"%{flip_flop}"] = flip_flops[bit + 1 : bit + 2]
+            if period >> bit & 1:
+                outputs[f"%{flip_flop}"].append(hub)
+            else:
+                outputs[f"&{hub}"].append(flip_flop)
+
+    lines = []
+    for module, module_outputs in outputs.items():
+        rng.shuffle(module_outputs)
+        lines.append(f"{module} -> {', '.join(module_outputs)}")
+    rng.shuffle(lines)
+
+    return lines
+
+
+def mirror_pattern(rng: Random) -> list[str]:
+    """Generate a mirror pattern for day 13.
+
+    :param rng: Random generator
+    :return: Pattern lines
+    """
+    while True:
+        width = rng.randrange(5, 18, 2)
+        height = rng.randint(5, 17)
+        column = rng.randrange(width - 1)
+        row = rng.randrange(height - 1)
+        column_span = min(column + 1, width - column - 1)
+        row_span = min(row + 1, height - row - 1)
+
+        pattern = []
+        for _ in range(height):
+            cells = rng.choices(".#", k=width)
+            for k in range(column_span):
+                cells[column + 1 + k] = cells[column - k]
+            pattern.append(cells)
+        for k in range(row_span):
+            pattern[row + 1 + k] = pattern[row - k].copy()
+
+        outside = [
+            x
+            for x in range(width)
+            if not column - column_span < x <= column + column_span
+        ]
+        y = row + 1 + rng.randrange(row_span)
+        x = rng.choice(outside)
+        pattern[y][x] = "#" if pattern[y][x] == "." else "."
+
+        lines = ["".join(cells) for cells in pattern]
+        if not any(
+            all(
+                lines[j - k] == lines[j + k + 1]
+                for k in range(min(j + 1, height - j - 1))
+            )
+            for j in range(height - 1)
+        ):
+            return lines
+
+
+def pipe(d_x_1: int, d_y_1: int, d_x_2: int, d_y_2: int) -> str:
+    """Get the pipe connecting two neighbouring directions.
+
+    :param d_x_1: First neighbour x offset
+    :param d_y_1: First neighbour y offset
+    :param d_x_2: Second neighbour x offset
+    :param d_y_2: Second neighbour y offset
+    :return: Pipe character
+    """
+    pipes = {
+        frozenset([(0, -1), (0, 1)]): "|",
+        frozenset([(-1, 0), (1, 0)]): "-",
+        frozenset([(0, -1), (1, 0)]): "L",
+        frozenset([(0, -1), (-1, 0)]): "J",
+        frozenset([(0, 1), (-1, 0)]): "7",
+        frozenset([(0, 1), (1, 0)]): "F",
+    }
+
+    return pipes[frozenset([(d_x_1, d_y_1), (d_x_2, d_y_2)])]
+
+
+def random_word(rng: Random, min_length: int, max_length: int) -> str:
+    """Generate a random lowercase word.
+
+    :param rng: Random generator
+    :param min_length: Minimum length
+    :param max_length: Maximum length
+    :return: Random word
+    """
+    length = rng.randint(min_length, max_length)
+
+    return "".join(rng.choices(string.ascii_lowercase, k=length))
+
+
+def skyline(
+    rng: Random, columns: int, max_width: int, max_height: int
+) -> list[tuple[str, int]]:
+    """Generate the instructions digging a skyline.
+
+    :param rng: Random generator
+    :param columns: Number of columns
+    :param max_width: Maximum column width
+    :param max_height: Maximum column height
+    :return: List of (direction, distance) tuples
+    """
+    heights = [rng.randint(2, max_height)]
+    for _ in range(columns - 1):
+        height = rng.randint(2, max_height - 3)
+        heights.append(height + 3 if height >= heights[-1] - 1 else height)
+
+    instructions = []
+    width = 0
+
+    for i, height in enumerate(heights):
+        column_width = rng.randint(2, max(2, max_width))
+        width += column_width
+        instructions.append(("R", column_width))
+        if i + 1 < len(heights):
+            step = heights[i + 1] - height
+            instructions.append(("U" if step > 0 else "D", abs(step)))
+
+    instructions.extend([("D", heights[-1]), ("L", width), ("U", heights[0])])
+
+    return instructions
+
+
+def unique_names(rng: Random, exclude: set[str]) -> Iterator[str]:
+    """Generate unique lowercase names of increasing length.
+
+    :param rng: Random generator
+    :param exclude: Names never generated
+    :return: Names iterator
+    """
+    for length in count(2):
+        names = [
+            "".join(name)
+            for name in product(string.ascii_lowercase, repeat=length)
+        ]
+        rng.shuffle(names)
+        yield from (name for name in names if name not in exclude)
+
+
+GENERATORS: dict[int, Callable[[int, Random], list[str]]] = {
+    1: generate_day_1,
+    2: generate_day_2,
+    3: generate_day_3,
+    4: generate_day_4,
+    5: generate_day_5,
+    6: generate_day_6,
+    7: generate_day_7,
+    8: generate_day_8,
+    9: generate_day_9,
+    10: generate_day_10,
+    11: generate_day_11,
+    12: generate_day_12,
+    13: generate_day_13,
+    14: generate_day_14,
+    15: generate_day_15,
+    16: generate_day_16,
+    17: generate_day_17,
+    18: generate_day_18,
+    19: generate_day_19,
+    20: generate_day_20,
+}
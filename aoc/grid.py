@@ -0,0 +1,96 @@
+"""Character grids as two-dimensional NumPy views."""
+
+from __future__ import annotations
+
+__author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
+__date__ = "2023"
+__license__ = "MIT"
+
+import mmap
+from typing import TYPE_CHECKING
+
+from aoc.lazy import lazy_import
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from numpy import uint8
+    from numpy.typing import NDArray
+
+np = lazy_import("numpy")
+
+
+def load_grid(
+    path: Path | str, pad: int = 0, fill: str = "."
+) -> NDArray[uint8]:
+    """Memory-map a grid file.
+
+    :param path: Grid file path
+    :param pad: Width of the border added around the grid
+    :param fill: Character of the border
+    :return: Read-only view of the mapped file, or a padded copy
+    """
+    with open(path, "rb") as grid_file:
+        buffer = mmap.mmap(grid_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    return parse_grid(buffer, pad=pad, fill=fill)
+
+
+def pad_grid(
+    grid: NDArray[uint8], pad: int, fill: str = "."
+) -> NDArray[uint8]:
+    """Add a border around a grid.
+
+    :param grid: Grid
+    :param pad: Width of the border
+    :param fill: Character of the border
+    :return: Padded copy of the grid
+    """
+    return np.pad(grid, pad, constant_values=ord(fill))
+
+
+def parse_grid(
+    raw_input: str | bytes | mmap.mmap, pad: int = 0, fill: str = "."
+) -> NDArray[uint8]:
+    """View newline-separated lines of equal length as a grid.
+
+    The view skips the newlines through its strides, so no per-line
+    objects are created and the trailing newline is optional.
+
+    :param raw_input: Raw grid
+    :param pad: Width of the border added around the grid
+    :param fill: Character of the border
+    :return: Read-only view of the input, or a padded copy
+    """
+    if isinstance(raw_input, str):
+        raw_input = raw_input.encode("ascii")
+
+    flat = np.frombuffer(raw_input, dtype=np.uint8)
+    width = raw_input.find(b"\n")
+    if width < 0:
+        width = len(flat)
+    rows = (len(flat) + 1) // (width + 1)
+
+    if not width or len(flat) not in (
+        rows * (width + 1),
+        rows * (width + 1) - 1,
+    ):
+        raise ValueError("Invalid grid!")
+
+    grid = np.lib.stride_tricks.as_strided(
+        flat, shape=(rows, width), strides=(width + 1, 1), writeable=False
+    )
+
+    if pad:
+        return pad_grid(grid, pad, fill)
+
+    return grid
+
+
+def to_lines(grid: NDArray[uint8]) -> list[str]:
+    """Convert a grid to a list of strings.
+
+    :param grid: Grid
+    :return: Grid lines
+    """
+    return [row.tobytes().decode("ascii") for row in grid]
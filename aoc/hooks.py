@@ -0,0 +1,105 @@
+"""Call counters and cumulative timers wrapped around hot functions."""
+
+__author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
+__date__ = "2023"
+__license__ = "MIT"
+
+import functools
+import importlib
+import os
+import time
+from typing import Any, Callable
+
+# Comma separated hook targets, inherited by worker processes
+HOOKS_ENV = "AOC_PROFILE_HOOKS"
+
+HOOK_STATS: dict[str, dict[str, int]] = {}
+
+
+def get_env_hooks(day: int) -> list[str]:
+    """Get the hook targets requested through the environment for a day.
+
+    :param day: Day number
+    :return: Dotted paths of the functions to wrap
+    """
+    targets = filter(None, os.environ.get(HOOKS_ENV, "").split(","))
+
+    return [
+        target.strip()
+        for target in targets
+        if target.strip().split(".")[0] == f"day_{day}"
+    ]
+
+
+def install_hooks(targets: list[str]) -> dict[str, dict[str, int]]:
+    """Wrap functions with call counters and cumulative timers.
+
+    Targets are dotted paths such as ``day_16.Beam.advance``. Installing a
+    target twice keeps the first wrapper, and counters are reset on every
+    call. Only the outermost call of a recursion is timed.
+
+    :param targets: Dotted paths of the functions to wrap
+    :return: Number of calls and cumulative wall-clock time of each target
+    """
+    for target in targets:
+        if target not in HOOK_STATS:
+            owner, name = resolve_target(target)
+            HOOK_STATS[target] = {}
+            setattr(
+                owner,
+                name,
+                wrap_hook(getattr(owner, name), HOOK_STATS[target]),
+            )
+        HOOK_STATS[target].update(calls=0, wall_ns=0)
+
+    return {target: HOOK_STATS[target] for target in targets}
+
+
+def resolve_target(target: str) -> tuple[Any, str]:
+    """Find the object owning the function at a dotted path.
+
+    :param target: Dotted path, starting with a module name
+    :return: Owner of the function and attribute name of the function
+    """
+    module_name, *attributes = target.split(".")
+    if not attributes:
+        raise ValueError(f"Invalid hook target: {target}")
+    *attributes, name = attributes
+
+    owner = importlib.import_module(module_name)
+    for attribute in attributes:
+        owner = getattr(owner, attribute)
+
+    if not callable(getattr(owner, name, None)):
+        raise ValueError(f"Invalid hook target: {target}")
+
+    return owner, name
+
+
+def wrap_hook(
+    function: Callable[..., Any], stats: dict[str, int]
+) -> Callable[..., Any]:
+    """Wrap a function with a call counter and a cumulative timer.
+
+    :param function: Function to wrap
+    :param stats: Counters updated by the wrapper
+    :return: Wrapped function
+    """
+    depth = 0
+
+    @functools.wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        nonlocal depth
+        stats["calls"] += 1
+        if depth:
+            return function(*args, **kwargs)
+
+        depth += 1
+        start = time.perf_counter_ns()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            stats["wall_ns"] += time.perf_counter_ns() - start
+            depth -= 1
+
+    return wrapper
@@ -0,0 +1,88 @@
+"""Peak memory and allocation sites of day solutions."""
+
+__author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
+__date__ = "2023"
+__license__ = "MIT"
+
+import threading
+import tracemalloc
+from typing import Any, Callable
+
+# Seconds between two checks of the traced memory
+SAMPLE_INTERVAL = 0.001
+
+# Minimum growth over the last snapshot before a new one is taken
+SNAPSHOT_GROWTH = 1.5
+
+TOP_SITES = 5
+
+
+def trace_memory(
+    function: Callable[..., Any], *args: Any
+) -> tuple[Any, dict[str, Any]]:
+    """Call a function under tracemalloc.
+
+    Only allocations made during the call are traced. The traced memory is
+    sampled by a background thread, which snapshots it whenever it grows
+    past the previous snapshot, so allocation sites and the number of
+    live blocks are reported as of the largest snapshot taken. Blocks
+    freed before that snapshot are not counted. Calls shorter than the
+    sampling interval report no sites.
+
+    :param function: Function to call
+    :param args: Positional arguments of the function
+    :return: Function result and memory report
+    """
+    stop = threading.Event()
+    snapshots: list[tracemalloc.Snapshot] = []
+
+    def sample() -> None:
+        snapshot_bytes = 0
+        while not stop.wait(SAMPLE_INTERVAL):
+            current_bytes, _ = tracemalloc.get_traced_memory()
+            if current_bytes > snapshot_bytes * SNAPSHOT_GROWTH:
+                snapshots[:] = [tracemalloc.take_snapshot()]
+                snapshot_bytes = current_bytes
+
+    sampler = threading.Thread(target=sample, daemon=True)
+
+    tracemalloc.start()
+    sampler.start()
+    try:
+        result = function(*args)
+    finally:
+        stop.set()
+        sampler.join()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    report: dict[str, Any] = {
+        "peak_bytes": peak_bytes,
+        "snapshot_live_blocks": 0,
+        "top_sites": [],
+    }
+
+    if snapshots:
+        statistics = (
+            snapshots[0]
+            .filter_traces(
+                [
+                    tracemalloc.Filter(False, tracemalloc.__file__),
+                    tracemalloc.Filter(False, threading.__file__),
+                    tracemalloc.Filter(False, __file__),
+                ]
+            )
+            .statistics("lineno")
+        )
+        report["snapshot_live_blocks"] = sum(stat.count for stat in statistics)
+        report["top_sites"] = [
+            {
+                "site": f"{stat.traceback[0].filename}:"
+                f"{stat.traceback[0].lineno}",
+                "bytes": stat.size,
+                "blocks": stat.count,
+            }
+            for stat in statistics[:TOP_SITES]
+        ]
+
+    return result, report
@@ -0,0 +1,115 @@
+"""Profile day solutions with cProfile and derive flame graph stacks."""
+
+__author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
+__date__ = "2023"
+__license__ = "MIT"
+
+import cProfile
+import pstats
+from pathlib import Path
+from typing import Any
+
+from aoc.runner import STARS, get_input_path, load_day, read_input
+
+PROFILES_DIR = Path(__file__).resolve().parent.parent / "profiles"
+
+# Call paths carrying less time than this are left out of collapsed stacks
+MIN_STACK_NS = 1_000
+
+
+def main(day: int, output_dir: Path) -> None:
+    """Profile a day and write its statistics and collapsed stacks.
+
+    :param day: Day number
+    :param output_dir: Output directory
+    """
+    stats = profile_day(day)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stats.dump_stats(output_dir / f"day_{day}.pstats")
+    write_collapsed(stats, output_dir / f"day_{day}.folded")
+
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(10)
+
+
+def collapse_stacks(stats: pstats.Stats) -> dict[str, int]:
+    """Derive flame graph stacks from profile statistics.
+
+    A profile only records caller-callee edges, so the time of a function
+    is split among its callees in proportion to the time of each edge, as
+    flameprof does. Recursive calls are cut at the first repetition.
+
+    :param stats: Profile statistics
+    :return: Self time in nanoseconds of every stack
+    """
+    entries = stats.stats  # type: ignore[attr-defined]
+    callees: dict[Any, dict[Any, float]] = {}
+    for function, (*_, callers) in entries.items():
+        for caller, (*_, edge_time) in callers.items():
+            callees.setdefault(caller, {})[function] = edge_time
+
+    stacks: dict[str, int] = {}
+
+    def visit(function: Any, stack: list[Any], time_s: float) -> None:
+        _, _, self_time, total_time, _ = entries[function]
+        fraction = time_s / total_time if total_time else 0.0
+        stack = [*stack, function]
+
+        key = ";".join(get_frame_name(frame) for frame in stack)
+        self_ns = int(self_time * fraction * 1e9)
+        if self_ns:
+            stacks[key] = stacks.get(key, 0) + self_ns
+
+        for callee, edge_time in callees.get(function, {}).items():
+            callee_time = edge_time * fraction
+            if callee not in stack and callee_time * 1e9 >= MIN_STACK_NS:
+                visit(callee, stack, callee_time)
+
+    for function, (*_, total_time, callers) in entries.items():
+        if not callers:
+            visit(function, [], total_time)
+
+    return stacks
+
+
+def get_frame_name(function: tuple[str, int, str]) -> str:
+    """Get the flame graph name of a profiled function.
+
+    :param function: File name, line number and function name
+    :return: Frame name
+    """
+    file_name, line, name = function
+    if file_name == "~":
+        return name
+
+    return f"{Path(file_name).stem}:{name}:{line}"
+
+
+def profile_day(day: int) -> pstats.Stats:
+    """Parse the shipped input of a day and solve it under cProfile.
+
+    :param day: Day number
+    :return: Profile statistics
+    """
+    module = load_day(day)
+    raw_input = read_input(get_input_path(day))
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    puzzle_input = module.parse_input(raw_input)
+    for star in STARS:
+        getattr(module, star)(puzzle_input)
+    profiler.disable()
+
+    return pstats.Stats(profiler)
+
+
+def write_collapsed(stats: pstats.Stats, path: Path) -> None:
+    """Write collapsed stacks in the format read by flame graph tools.
+
+    :param stats: Profile statistics
+    :param path: Output path
+    """
+    with open(path, "w", encoding="utf-8") as collapsed_file:
+        for stack, self_ns in sorted(collapse_stacks(stats).items()):
+            collapsed_file.write(f"{stack} {self_ns // 1000}\n")
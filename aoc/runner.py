@@ -0,0 +1,460 @@
+"""Run day solutions and time each step."""
+
+__author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
+__date__ = "2023"
+__license__ = "MIT"
+
+import importlib
+import json
+import os
+import platform
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Iterator
+
+from aoc.cache import AnswerCache, ParsedCache, get_key
+from aoc.hooks import get_env_hooks, install_hooks
+from aoc.memory import trace_memory
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+DAYS = list(range(1, 21))
+
+STARS = ["star_1", "star_2"]
+
+STEPS = ["load", *STARS]
+
+
+def main(
+    days: list[int],
+    report_path: str,
+    jobs: int,
+    split_stars: bool,
+    cache_bytes: int | None,
+    stream: bool = False,
+    memory: bool = False,
+    answer_cache: bool = False,
+    vectorized: bool = False,
+) -> None:
+    """Run days and write the timing report.
+
+    :param days: Days to run
+    :param report_path: Path of the JSON report
+    :param jobs: Number of worker processes, all cores if 0
+    :param split_stars: If each star is dispatched separately
+    :param cache_bytes: Size bound of the parsed input cache, no cache if
+        None
+    :param stream: If days supporting it solve both stars in one pass
+    :param memory: If peak memory and allocation sites are traced
+    :param answer_cache: If answers are looked up in and stored to the
+        answer cache
+    :param vectorized: If days supporting it solve stars vectorized over
+        the whole input file
+    """
+    report = run_days(
+        days,
+        jobs=jobs,
+        split_stars=split_stars,
+        cache_bytes=cache_bytes,
+        stream=stream,
+        memory=memory,
+        answer_cache=answer_cache,
+        vectorized=vectorized,
+    )
+
+    for day_report in report["days"]:
+        print_answers(day_report)
+        for target, stats in day_report.get("hooks", {}).items():
+            print(
+                f"  {target}: {stats['calls']} calls, "
+                f"{stats['wall_ns'] / 1e9:.3f} s"
+            )
+        for step, allocations in day_report.get("memory", {}).items():
+            print_allocations(step, allocations)
+
+    print(
+        f"Elapsed {report['elapsed_ns'] / 1e9:.2f} s, "
+        f"CPU {report['total']['cpu_ns'] / 1e9:.2f} s, "
+        f"jobs {report['jobs']}"
+    )
+
+    write_report(report, report_path)
+
+
+def add_timing(timing: dict[str, Any], extra: dict[str, int]) -> None:
+    """Add a timing to another one.
+
+    :param timing: Timing, updated in place
+    :param extra: Timing to add
+    """
+    for key, value in extra.items():
+        timing[key] += value
+
+
+def get_input_path(day: int) -> Path:
+    """Get the path of the shipped input of a day.
+
+    :param day: Day number
+    :return: Input path
+    """
+    return DATA_DIR / f"day_{day}_input.txt"
+
+
+def load_day(day: int) -> ModuleType:
+    """Import the module of a day.
+
+    :param day: Day number
+    :return: Day module
+    """
+    return importlib.import_module(f"day_{day}")
+
+
+def measure(
+    function: Callable[..., Any], *args: Any
+) -> tuple[Any, dict[str, int]]:
+    """Call a function and measure wall-clock and CPU time.
+
+    :param function: Function to call
+    :param args: Positional arguments of the function
+    :return: Function result and timing in nanoseconds
+    """
+    wall_start = time.perf_counter_ns()
+    cpu_start = time.process_time_ns()
+
+    result = function(*args)
+
+    cpu_ns = time.process_time_ns() - cpu_start
+    wall_ns = time.perf_counter_ns() - wall_start
+
+    return result, {"wall_ns": wall_ns, "cpu_ns": cpu_ns}
+
+
+def parse_days(spec: str) -> list[int]:
+    """Parse a days specification such as ``1-20`` or ``1,3,5-7``.
+
+    :param spec: Days specification
+    :return: Sorted list of days
+    """
+    days: set[int] = set()
+
+    for part in spec.split(","):
+        first, _, last = part.strip().partition("-")
+        days.update(range(int(first), int(last or first) + 1))
+
+    invalid = days.difference(DAYS)
+    if invalid:
+        raise ValueError(f"Invalid days: {sorted(invalid)}")
+
+    return sorted(days)
+
+
+def print_answers(report: dict[str, Any]) -> None:
+    """Print the answers of a day report.
+
+    :param report: Day report
+    """
+    print(f"Day {report['day']}")
+    for i, star in enumerate(STARS, start=1):
+        cached = (
+            " (cached)"
+            if report["timings"].get(star, {}).get("cached")
+            else ""
+        )
+        print(f"Star {i}: {report['answers'][star]}{cached}")
+
+
+def print_allocations(step: str, allocations: dict[str, Any]) -> None:
+    """Print the memory report of a step.
+
+    :param step: Step name
+    :param allocations: Memory report
+    """
+    print(
+        f"  {step}: peak {allocations['peak_bytes'] / 2**20:.2f} MiB, "
+        f"{allocations['snapshot_live_blocks']} live blocks at largest "
+        "snapshot"
+    )
+    for site in allocations["top_sites"]:
+        print(
+            f"    {site['site']}: {site['bytes'] / 2**20:.2f} MiB "
+            f"in {site['blocks']} blocks"
+        )
+
+
+def read_input(path: Path) -> str:
+    """Read a raw puzzle input.
+
+    :param path: Input path
+    :return: Raw puzzle input
+    """
+    with open(path, encoding="ascii") as input_file:
+        return input_file.read()
+
+
+def read_lines(path: Path) -> Iterator[str]:
+    """Lazily read the lines of a raw puzzle input.
+
+    :param path: Input path
+    :return: Generator of input lines
+    """
+    with open(path, encoding="ascii") as input_file:
+        yield from input_file
+
+
+def merge_reports(reports: list[dict[str, Any]]) -> dict[str, Any]:
+    """Merge reports of separate star runs of the same day.
+
+    Each run loads the input on its own, so load timings and hook
+    counters are summed, while flags such as traced timings are kept.
+
+    :param reports: Day reports of single stars
+    :return: Day report
+    """
+    merged = {**reports[0], "answers": {}, "timings": {}}
+    if "hooks" in merged:
+        merged["hooks"] = {}
+    if "memory" in merged:
+        merged["memory"] = {}
+
+    for report in reports:
+        merged["answers"].update(report["answers"])
+        merged.get("memory", {}).update(report.get("memory", {}))
+        for field in ["timings", "hooks"]:
+            for name, counters in report.get(field, {}).items():
+                merged_counters = merged[field].setdefault(
+                    name, dict.fromkeys(counters, 0)
+                )
+                for key, value in counters.items():
+                    if isinstance(value, bool):
+                        merged_counters[key] = merged_counters[key] or value
+                    else:
+                        merged_counters[key] += value
+
+    return merged
+
+
+def run_day(
+    day: int,
+    input_path: Path | None = None,
+    stars: list[str] | None = None,
+    cache_bytes: int | None = None,
+    stream: bool = False,
+    memory: bool = False,
+    answer_cache: bool = False,
+    vectorized: bool = False,
+) -> dict[str, Any]:
+    """Run the stars of a day, timing each step separately.
+
+    In streaming mode, days providing ``solve_stream`` solve both stars in
+    a single pass over the lines of the input file, timed as one step.
+
+    In vectorized mode, the stars a day maps to a function of the input
+    path in ``VECTORIZED_STARS`` are solved over the whole file, without
+    loading it, and are never cached.
+
+    Without caches, days providing ``parse_file`` parse the input file
+    directly, e.g. memory-mapping a grid, the load step timing the parse
+    alone.
+
+    :param day: Day number
+    :param input_path: Input path, the shipped input if None
+    :param stars: Stars to run, both if None
+    :param cache_bytes: Size bound of the parsed input cache, no cache if
+        None
+    :param stream: If the day is solved in one pass when supported
+    :param memory: If peak memory and allocation sites of the solving
+        steps are traced, in which case their timings include the tracing
+        overhead and are flagged as traced
+    :param answer_cache: If answers are looked up in and stored to the
+        answer cache, in which case the input is only parsed on a miss and
+        cached stars are flagged with no time, the lookup being timed as
+        part of the load; ignored when hooks or memory are measured
+    :param vectorized: If stars are solved over the whole input file when
+        supported
+    :return: Day report
+    """
+    module = load_day(day)
+    path = input_path or get_input_path(day)
+    hooks = install_hooks(get_env_hooks(day))
+    answer_cache = answer_cache and not hooks and not memory
+    file_stars = getattr(module, "VECTORIZED_STARS", {}) if vectorized else {}
+
+    def load(raw_input: str | None) -> Any:
+        if raw_input is None:
+            return module.parse_file(path)
+        if cache_bytes is None:
+            return module.parse_input(raw_input)
+        return ParsedCache(max_bytes=cache_bytes).load(day, module, raw_input)
+
+    answers = {}
+    timings = {}
+    allocations = {}
+
+    def solve(step: str, function: Callable[..., Any], *args: Any) -> Any:
+        if not memory:
+            result, timings[step] = measure(function, *args)
+            return result
+        (result, allocations[step]), timing = measure(
+            trace_memory, function, *args
+        )
+        timings[step] = {**timing, "traced": True}
+        return result
+
+    def solve_loaded(loaded_stars: list[str]) -> None:
+        if (
+            hasattr(module, "parse_file")
+            and cache_bytes is None
+            and not answer_cache
+        ):
+            raw_input = None
+            timings["load"] = {"wall_ns": 0, "cpu_ns": 0}
+        else:
+            raw_input, timings["load"] = measure(read_input, path)
+        key = (
+            get_key(module, raw_input)
+            if raw_input is not None and answer_cache
+            else None
+        )
+        puzzle_input = None
+        parsed = False
+
+        for star in loaded_stars:
+            if key is not None:
+                answer, lookup_timing = measure(
+                    AnswerCache().get, day, star, key
+                )
+                add_timing(timings["load"], lookup_timing)
+                if answer is not None:
+                    answers[star] = answer
+                    timings[star] = {"wall_ns": 0, "cpu_ns": 0, "cached": True}
+                    continue
+
+            if not parsed:
+                puzzle_input, parse_timing = measure(load, raw_input)
+                add_timing(timings["load"], parse_timing)
+                parsed = True
+
+            answers[star] = solve(star, getattr(module, star), puzzle_input)
+            if key is not None:
+                AnswerCache().store(day, star, key, answers[star])
+
+    if stream and hasattr(module, "solve_stream"):
+        solutions = solve("stream", module.solve_stream, read_lines(path))
+        answers.update(zip(STARS, solutions))
+    else:
+        answers.update(
+            (star, solve(star, file_stars[star], path))
+            for star in stars or STARS
+            if star in file_stars
+        )
+        loaded_stars = [
+            star for star in stars or STARS if star not in file_stars
+        ]
+        if loaded_stars:
+            solve_loaded(loaded_stars)
+
+    report = {
+        "day": day,
+        "input": str(path),
+        "answers": answers,
+        "timings": timings,
+    }
+    if memory:
+        report["memory"] = allocations
+    if hooks:
+        report["hooks"] = {
+            target: dict(stats) for target, stats in hooks.items()
+        }
+
+    return report
+
+
+def run_days(
+    days: list[int],
+    jobs: int = 1,
+    split_stars: bool = False,
+    cache_bytes: int | None = None,
+    stream: bool = False,
+    memory: bool = False,
+    answer_cache: bool = False,
+    vectorized: bool = False,
+) -> dict[str, Any]:
+    """Run a list of days, optionally over a pool of worker processes.
+
+    :param days: Days to run
+    :param jobs: Number of worker processes, all cores if 0
+    :param split_stars: If each star is dispatched separately
+    :param cache_bytes: Size bound of the parsed input cache, no cache if
+        None
+    :param stream: If days supporting it solve both stars in one pass
+    :param memory: If peak memory and allocation sites are traced
+    :param answer_cache: If answers are looked up in and stored to the
+        answer cache
+    :param vectorized: If days supporting it solve stars vectorized over
+        the whole input file
+    :return: Full report
+    """
+    star_groups: list[list[str] | None] = (
+        [[star] for star in STARS] if split_stars else [None]
+    )
+    tasks = [(day, stars) for day in days for stars in star_groups]
+    run = partial(
+        run_day,
+        cache_bytes=cache_bytes,
+        stream=stream,
+        memory=memory,
+        answer_cache=answer_cache,
+        vectorized=vectorized,
+    )
+
+    jobs = jobs or os.cpu_count() or 1
+
+    start = time.perf_counter_ns()
+    if jobs == 1:
+        reports = [run(day, None, stars) for day, stars in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            reports = list(
+                executor.map(
+                    run,
+                    [day for day, _ in tasks],
+                    [None] * len(tasks),
+                    [stars for _, stars in tasks],
+                )
+            )
+    elapsed_ns = time.perf_counter_ns() - start
+
+    if split_stars:
+        reports = [
+            merge_reports(reports[i : i + len(STARS)])
+            for i in range(0, len(reports), len(STARS))
+        ]
+
+    return {
+        "python": platform.python_version(),
+        "jobs": jobs,
+        "days": reports,
+        "total": {
+            key: sum(
+                timing[key]
+                for report in reports
+                for timing in report["timings"].values()
+            )
+            for key in ["wall_ns", "cpu_ns"]
+        },
+        "elapsed_ns": elapsed_ns,
+    }
+
+
+def write_report(report: dict[str, Any], report_path: str) -> None:
+    """Write a report as JSON.
+
+    :param report: Report
+    :param report_path: Path of the JSON report
+    """
+    with open(report_path, "w", encoding="utf-8") as report_file:
+        json.dump(report, report_file, indent=2)
+        report_file.write("\n")
@@ -0,0 +1,115 @@
+"""Measure the import time of day modules against a startup budget."""
+
+__author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
+__date__ = "2023"
+__license__ = "MIT"
+
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+DEFAULT_BUDGET_MS = 50.0
+
+TOP_MODULES = 5
+
+IMPORT_TIME_LINE = re.compile(
+    r"import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \|"
+    r"(?P<indent>\s+)(?P<module>\S+)"
+)
+
+
+def main(days: list[int], budget_ms: float, repeat: int) -> None:
+    """Measure the import time of days and fail over the budget.
+
+    :param days: Days to measure
+    :param budget_ms: Maximum import time of a day in milliseconds
+    :param repeat: Number of measurements per day, the fastest is kept
+    """
+    over_budget = []
+
+    for day in days:
+        result = measure_import(f"day_{day}", repeat)
+        print(f"Day {day}: {result['cumulative_us'] / 1000:.1f} ms")
+        for module, self_us in result["top_modules"]:
+            print(f"  {module}: {self_us / 1000:.1f} ms")
+        if result["cumulative_us"] > budget_ms * 1000:
+            over_budget.append(day)
+
+    if over_budget:
+        print(
+            f"Days over the startup budget of {budget_ms:g} ms: "
+            f"{', '.join(map(str, over_budget))}"
+        )
+        sys.exit(1)
+
+
+def measure_import(module: str, repeat: int) -> dict[str, Any]:
+    """Import a module in fresh interpreters with ``-X importtime``.
+
+    :param module: Module name
+    :param repeat: Number of measurements, the fastest is kept
+    :return: Cumulative import time of the module and its most expensive
+        dependencies, in microseconds
+    """
+    best: dict[str, Any] = {}
+
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            check=True,
+            cwd=ROOT_DIR,
+            text=True,
+        )
+        result = parse_import_times(completed.stderr, module)
+        if not best or result["cumulative_us"] < best["cumulative_us"]:
+            best = result
+
+    return best
+
+
+def parse_import_times(log: str, module: str) -> dict[str, Any]:
+    """Parse the ``-X importtime`` log of a top-level import.
+
+    Nested imports are logged before the module importing them, with a
+    deeper indentation, so the dependencies of a module are the deeper
+    lines right above it.
+
+    :param log: Standard error of the interpreter
+    :param module: Name of the top-level module
+    :return: Cumulative import time of the module and its most expensive
+        dependencies, in microseconds
+    """
+    entries = [
+        (
+            match["module"],
+            len(match["indent"]),
+            int(match["self"]),
+            int(match["cumulative"]),
+        )
+        for match in map(IMPORT_TIME_LINE.match, log.splitlines())
+        if match
+    ]
+
+    for i, (name, indent, _, cumulative_us) in enumerate(entries):
+        if name == module and indent == 1:
+            break
+    else:
+        raise ValueError(f"Module {module} not found in import log")
+
+    dependencies = []
+    for name, dependency_indent, self_us, _ in reversed(entries[:i]):
+        if dependency_indent <= indent:
+            break
+        dependencies.append((name, self_us))
+
+    dependencies.sort(key=lambda dependency: dependency[1], reverse=True)
+
+    return {
+        "cumulative_us": cumulative_us,
+        "top_modules": dependencies[:TOP_MODULES],
+    }
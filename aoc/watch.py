@@ -0,0 +1,167 @@
+"""Re-solve days when their inputs change."""
+
+__author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
+__date__ = "2023"
+__license__ = "MIT"
+
+import os
+import time
+from typing import Any
+
+from aoc.chunked import CHUNKED_DAYS, fold_partial, solve_lines
+from aoc.runner import STARS, get_input_path, measure, print_answers, run_day
+
+DEFAULT_INTERVAL = 0.5
+
+# Bytes kept from the end of the solved lines to detect appends
+TAIL_BYTES = 4096
+
+
+class WatchedDay:
+    """Input file of a day and the state needed to re-solve it.
+
+    Days that can be solved in chunks keep the running state of the
+    complete lines read so far, along with the last bytes of these lines.
+    When the same file grows and still holds these bytes at the same
+    offset, only the appended lines are solved and folded into the state,
+    so an update costs the appended bytes alone. Any other change solves
+    the day from scratch, except for edits in place before these bytes,
+    which are not detected.
+    """
+
+    def __init__(self, day: int) -> None:
+        self.day = day
+        self.path = get_input_path(day)
+        self.signature: tuple[int, int] | None = None
+        self.inode = 0
+        self.size = 0
+        self.tail = b""
+        self.state: Any = None
+
+    def refresh(self) -> dict[str, Any] | None:
+        """Re-solve the day if its input changed.
+
+        :return: Day report, None if the input did not change
+        """
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == self.signature:
+            return None
+        self.signature = signature
+
+        if self.day not in CHUNKED_DAYS:
+            return run_day(self.day, answer_cache=True)
+
+        report, timing = measure(self.solve_incrementally, stat)
+        report["timings"] = {"update": timing}
+
+        return report
+
+    def solve_incrementally(self, stat: os.stat_result) -> dict[str, Any]:
+        """Solve the lines appended since the last call, or the whole input.
+
+        Only complete lines are folded into the state. A last line without
+        a newline, possibly still being written, is solved on its own each
+        time and folded into a copy of the state.
+
+        :param stat: Current status of the input
+        :return: Day report without timings
+        """
+        size = stat.st_size
+        with open(self.path, "rb") as input_file:
+            input_file.seek(self.size - len(self.tail))
+            appended = (
+                stat.st_ino == self.inode
+                and 0 < self.size <= size
+                and input_file.read(len(self.tail)) == self.tail
+            )
+            start = self.size if appended else 0
+            input_file.seek(start)
+            new = input_file.read(size - start)
+
+        complete = new[: new.rfind(b"\n") + 1]
+        state = self.state if appended else None
+        if complete:
+            state = fold_partial(
+                self.day, state, solve_lines(self.day, split_lines(complete))
+            )
+            tail = self.tail if appended else b""
+            self.tail = (tail + complete[-TAIL_BYTES:])[-TAIL_BYTES:]
+        elif not appended:
+            self.tail = b""
+        self.inode = stat.st_ino
+        self.size, self.state = start + len(complete), state
+
+        solutions = fold_partial(
+            self.day,
+            state,
+            solve_lines(self.day, split_lines(new[len(complete) :])),
+        )
+
+        return {
+            "day": self.day,
+            "input": str(self.path),
+            "answers": dict(zip(STARS, solutions)),
+            "appended_bytes": size - start if appended else None,
+        }
+
+
+def split_lines(data: bytes) -> list[str]:
+    """Decode the lines of some input bytes.
+
+    :param data: Input bytes
+    :return: Input lines
+    """
+    return data.decode("ascii").splitlines(keepends=True)
+
+
+def main(days: list[int], interval: float) -> None:
+    """Watch the inputs of days and print new answers on every change.
+
+    A day failing to solve, e.g. on a partially written line, is reported
+    and solved again on its next change.
+
+    :param days: Days to watch
+    :param interval: Seconds between two polls of the inputs
+    """
+    watched = [WatchedDay(day) for day in days]
+    print(f"Watching the inputs of {len(watched)} days, Ctrl+C to stop")
+
+    try:
+        while True:
+            for watched_day in watched:
+                try:
+                    report = watched_day.refresh()
+                # pylint: disable-next=broad-exception-caught
+                except Exception as error:
+                    print(
+                        f"Day {watched_day.day}: "
+                        f"{type(error).__name__}: {error}"
+                    )
+                    continue
+                if report is not None:
+                    print_update(report)
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+
+
+def print_update(report: dict[str, Any]) -> None:
+    """Print the answers of a re-solved day.
+
+    :param report: Day report
+    """
+    print_answers(report)
+
+    wall_ns = sum(timing["wall_ns"] for timing in report["timings"].values())
+    if report.get("appended_bytes") is not None:
+        print(
+            f"Solved {report['appended_bytes']} appended bytes "
+            f"in {wall_ns / 1e6:.2f} ms"
+        )
+    else:
+        print(f"Solved in {wall_ns / 1e6:.2f} ms")
@@ -1,57 +1,240 @@
 """Day 1: Trebuchet?!"""
 
+from __future__ import annotations
+
 __author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
 __date__ = "2023"
 __license__ = "MIT"
 
-SPELLED_DIGITS = {
-    "one": "one1one",
-    "two": "two2two",
-    "three": "three3three",
-    "four": "four4four",
-    "five": "five5five",
-    "six": "six6six",
-    "seven": "seven7seven",
-    "eight": "eight8eight",
-    "nine": "nine9nine",
-}
+import mmap
+from collections import deque
+from typing import TYPE_CHECKING, Iterable
+
+from aoc.lazy import lazy_import
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from numpy import uint8
+    from numpy.typing import NDArray
+
+np = lazy_import("numpy")
+
+# Bytes processed at once by the vectorized calibration
+BLOCK_SIZE = 2**24
+
+SPELLED_DIGITS = [
+    "one",
+    "two",
+    "three",
+    "four",
+    "five",
+    "six",
+    "seven",
+    "eight",
+    "nine",
+]
+
+Automaton = tuple[list[dict[str, int]], list[int]]
 
 
 def main() -> None:
     """Solve day 1 puzzles."""
     with open("data/day_1_input.txt", encoding="ascii") as input_file:
-        puzzle_input = input_file.readlines()
+        puzzle_input = parse_input(input_file.read())
 
-    star_1(puzzle_input)
+    print(f"Star 1: {star_1(puzzle_input)}")
 
-    star_2(puzzle_input)
+    print(f"Star 2: {star_2(puzzle_input)}")
 
 
-def star_1(puzzle_input: list[str]) -> None:
+def star_1(puzzle_input: list[str]) -> int:
     """Solve the first puzzle.
 
     :param puzzle_input: Puzzle input
+    :return: Solution
     """
     total = 0
 
     for line in puzzle_input:
         total += get_star_calibration_value(line)
 
-    print(f"Star 1: {total}")
+    return total
 
 
-def star_2(puzzle_input: list[str]) -> None:
+def star_2(puzzle_input: list[str]) -> int:
     """Solve the second puzzle.
 
     :param puzzle_input: Puzzle input
+    :return: Solution
     """
     total = 0
 
     for line in puzzle_input:
-        line = replace_spelled_digits(line)
-        total += get_star_calibration_value(line)
+        total += get_spelled_calibration_value(line)
+
+    return total
+
+
+def solve_stream(lines: Iterable[str]) -> tuple[int, int]:
+    """Solve both puzzles in a single pass over the input lines.
+
+    :param lines: Input lines
+    :return: Solutions of both puzzles
+    """
+    total_1 = 0
+    total_2 = 0
+
+    for line in lines:
+        total_1 += get_star_calibration_value(line)
+        total_2 += get_spelled_calibration_value(line)
+
+    return total_1, total_2
+
+
+def build_automaton(patterns: dict[str, int]) -> Automaton:
+    """Build an Aho-Corasick automaton matching a set of patterns.
+
+    Transitions are completed along failure links, so every character is
+    consumed by a single lookup, and characters outside of the patterns go
+    back to the root.
+
+    :param patterns: Value of each pattern
+    :return: Transitions of each state and value matched in each state, 0
+        if none
+    """
+    transitions: list[dict[str, int]] = [{}]
+    values = [0]
+
+    for pattern, value in patterns.items():
+        state = 0
+        for character in pattern:
+            if character not in transitions[state]:
+                transitions.append({})
+                values.append(0)
+                transitions[state][character] = len(transitions) - 1
+            state = transitions[state][character]
+        values[state] = value
+
+    alphabet = set("".join(patterns))
+    failures = [0] * len(transitions)
+    queue = deque(transitions[0].values())
+
+    while queue:
+        state = queue.popleft()
+        values[state] = values[state] or values[failures[state]]
+        for character in alphabet:
+            if character in transitions[state]:
+                child = transitions[state][character]
+                failures[child] = transitions[failures[state]].get(
+                    character, 0
+                )
+                queue.append(child)
+            elif failures[state] or character in transitions[0]:
+                transitions[state][character] = transitions[
+                    failures[state]
+                ].get(character, 0)
+
+    return transitions, values
+
+
+def find_digit(characters: Iterable[str], automaton: Automaton) -> int:
+    """Find the first digit, numeric or spelled out, in a text.
+
+    No digit pattern contains another one, so the first match to end is
+    also the first one to start.
+
+    :param characters: Characters of the text
+    :param automaton: Automaton matching the digits
+    :return: Value of the digit
+    """
+    transitions, values = automaton
+    state = 0
+
+    for character in characters:
+        state = transitions[state].get(character, 0)
+        if values[state]:
+            return values[state]
+
+    raise ValueError("Invalid input!")
 
-    print(f"Star 2: {total}")
+
+def calibrate_block(block: NDArray[uint8]) -> int:
+    """Sum the calibration values of complete lines with NumPy.
+
+    The first and last digit of each line are found by binary search of
+    the line boundaries among the sorted digit positions.
+
+    :param block: Bytes of complete lines
+    :return: Sum of calibration values
+    """
+    # Bytes below "0" wrap around to large values
+    digit_positions = np.flatnonzero(block - ord("0") < 10)
+    line_ends = np.flatnonzero(block == ord("\n"))
+    if block[-1] != ord("\n"):
+        line_ends = np.append(line_ends, len(block))
+    line_starts = np.r_[0, line_ends[:-1] + 1]
+
+    first_indices = np.searchsorted(digit_positions, line_starts)
+    last_indices = np.searchsorted(digit_positions, line_ends) - 1
+    if np.any(first_indices > last_indices):
+        raise ValueError("Invalid input!")
+
+    first_digits = block[digit_positions[first_indices]] - ord("0")
+    last_digits = block[digit_positions[last_indices]] - ord("0")
+
+    return int(
+        10 * first_digits.sum(dtype=np.int64) + last_digits.sum(dtype=np.int64)
+    )
+
+
+def calibrate_buffer(buffer: bytes | mmap.mmap) -> int:
+    """Solve the first puzzle over a raw input buffer.
+
+    The buffer is processed in blocks of complete lines, so memory use is
+    bounded regardless of the input size.
+
+    :param buffer: Raw puzzle input
+    :return: Solution
+    """
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    total = 0
+    start = 0
+
+    while start < len(data):
+        end = buffer.find(b"\n", min(start + BLOCK_SIZE, len(data)) - 1)
+        end = len(data) if end < 0 else end + 1
+        total += calibrate_block(data[start:end])
+        start = end
+
+    return total
+
+
+def calibrate_file(path: Path | str) -> int:
+    """Solve the first puzzle over a memory-mapped input file.
+
+    :param path: Input path
+    :return: Solution
+    """
+    with open(path, "rb") as input_file, mmap.mmap(
+        input_file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as buffer:
+        return calibrate_buffer(buffer)
+
+
+def get_spelled_calibration_value(line: str) -> int:
+    """Get calibration value from line, including spelled out digits.
+
+    The last digit is the first one of the reversed line, matched by an
+    automaton of the reversed digits.
+
+    :param line: Line to process
+    :return: Calibration value
+    """
+    first_digit = find_digit(line, FORWARD_DIGITS)
+    last_digit = find_digit(reversed(line), BACKWARD_DIGITS)
+
+    return 10 * first_digit + last_digit
 
 
 def get_star_calibration_value(line: str) -> int:
@@ -67,16 +250,28 @@ def get_star_calibration_value(line: str) -> int:
     return two_digit_number
 
 
-def replace_spelled_digits(line: str) -> str:
-    """Replace spelled out digits with numbers.
+def parse_input(raw_input: str) -> list[str]:
+    """Parse raw puzzle input.
 
-    :param line: Line to process
-    :return: Processed line
+    :param raw_input: Raw puzzle input
+    :return: Puzzle input
     """
-    for spelled, digit in SPELLED_DIGITS.items():
-        line = line.replace(spelled, digit)
+    return raw_input.splitlines(keepends=True)
+
+
+DIGITS = {
+    **{spelled: i for i, spelled in enumerate(SPELLED_DIGITS, start=1)},
+    **{str(i): i for i in range(1, 10)},
+}
+
+FORWARD_DIGITS = build_automaton(DIGITS)
+
+BACKWARD_DIGITS = build_automaton(
+    {pattern[::-1]: value for pattern, value in DIGITS.items()}
+)
 
-    return line
+# Stars solved over the whole input file in vectorized mode
+VECTORIZED_STARS = {"star_1": calibrate_file}
 
 
 if __name__ == "__main__":
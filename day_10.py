@@ -4,23 +4,24 @@ __author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
 __date__ = "2023"
 __license__ = "MIT"
 
+from aoc.grid import parse_grid, to_lines
+
 
 def main() -> None:
     """Solve day 10 puzzles."""
     with open("data/day_10_input.txt", encoding="ascii") as input_file:
-        raw_input = input_file.readlines()
-
-    puzzle_input = pad_input(raw_input)
+        puzzle_input = parse_input(input_file.read())
 
-    star_1(puzzle_input)
+    print(f"Star 1: {star_1(puzzle_input)}")
 
-    star_2(puzzle_input)
+    print(f"Star 2: {star_2(puzzle_input)}")
 
 
-def star_1(puzzle_input: list[str]) -> None:
+def star_1(puzzle_input: list[str]) -> int:
     """Solve the first puzzle.
 
     :param puzzle_input: Puzzle input
+    :return: Solution
     """
     step = 1
 
@@ -36,13 +37,14 @@ def star_1(puzzle_input: list[str]) -> None:
         )
         step += 1
 
-    print(f"Star 1: {step//2}")
+    return step // 2
 
 
-def star_2(puzzle_input: list[str]) -> None:
+def star_2(puzzle_input: list[str]) -> int:
     """Solve the second puzzle.
 
     :param puzzle_input: Puzzle input
+    :return: Solution
     """
     loop = set()
 
@@ -78,7 +80,7 @@ def star_2(puzzle_input: list[str]) -> None:
             elif in_flag and (i, j) not in loop:
                 area += 1
 
-    print(f"Star 2: {area}")
+    return area
 
 
 def get_starting_position(
@@ -137,20 +139,13 @@ def execute_step(
     return current, next_
 
 
-def pad_input(raw_input: list[str]) -> list[str]:
-    """Pad input.
+def parse_input(raw_input: str) -> list[str]:
+    """Parse raw puzzle input.
 
-    :param raw_input: Puzzle input
-    :return: Padded input
+    :param raw_input: Raw puzzle input
+    :return: Puzzle input
     """
-    matrix_input = []
-
-    matrix_input.append("." * (len(raw_input[0]) + 1))
-    for line in raw_input:
-        matrix_input.append("." + line.strip() + ".")
-    matrix_input.append("." * (len(raw_input[0]) + 1))
-
-    return matrix_input
+    return to_lines(parse_grid(raw_input, pad=1))
 
 
 def update_flags(
@@ -1,24 +1,40 @@
 """Day 11: Cosmic Expansion."""
 
+from __future__ import annotations
+
 __author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
 __date__ = "2023"
 __license__ = "MIT"
 
+from typing import TYPE_CHECKING
+
+from aoc.grid import load_grid, parse_grid
+from aoc.lazy import lazy_import
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from numpy import uint8
+    from numpy.typing import NDArray
+
+np = lazy_import("numpy")
+
 
 def main() -> None:
     """Solve day 11 puzzles."""
     with open("data/day_11_input.txt", encoding="ascii") as input_file:
-        puzzle_input = input_file.readlines()
+        puzzle_input = parse_input(input_file.read())
 
-    star_1(puzzle_input)
+    print(f"Star 1: {star_1(puzzle_input)}")
 
-    star_2(puzzle_input)
+    print(f"Star 2: {star_2(puzzle_input)}")
 
 
-def star_1(puzzle_input: list[str]) -> None:
+def star_1(puzzle_input: NDArray[uint8]) -> int:
     """Solve the first puzzle.
 
     :param puzzle_input: Puzzle input
+    :return: Solution
     """
     galaxies = input_2_list(puzzle_input)
     galaxies = expand(galaxies=galaxies, factor=2)
@@ -30,13 +46,14 @@ def star_1(puzzle_input: list[str]) -> None:
             distance = abs(g_2[0] - g_1[0]) + abs(g_2[1] - g_1[1])
             total += distance
 
-    print(f"Star 1: {total}")
+    return total
 
 
-def star_2(puzzle_input: list[str]) -> None:
+def star_2(puzzle_input: NDArray[uint8]) -> int:
     """Solve the second puzzle.
 
     :param puzzle_input: Puzzle input
+    :return: Solution
     """
     galaxies = input_2_list(puzzle_input)
     galaxies = expand(galaxies=galaxies, factor=1000000)
@@ -48,7 +65,7 @@ def star_2(puzzle_input: list[str]) -> None:
             distance = abs(g_2[0] - g_1[0]) + abs(g_2[1] - g_1[1])
             total += distance
 
-    print(f"Star 2: {total}")
+    return total
 
 
 def expand(
@@ -85,19 +102,33 @@ def expand(
     return galaxies
 
 
-def input_2_list(puzze_input: list[str]) -> list[tuple[int, int]]:
+def input_2_list(puzzle_input: NDArray[uint8]) -> list[tuple[int, int]]:
     """Convert input to list of galaxies.
 
     :param puzzle_input: Puzzle input
     :return: List of positions of galaxies
     """
-    galaxies = []
-    for j, line in enumerate(puzze_input):
-        for i, character in enumerate(line):
-            if character == "#":
-                galaxies.append((i, j))
+    y_s, x_s = np.nonzero(puzzle_input == ord("#"))
 
-    return galaxies
+    return list(zip(x_s.tolist(), y_s.tolist()))
+
+
+def parse_file(path: Path | str) -> NDArray[uint8]:
+    """Parse a memory-mapped puzzle input file.
+
+    :param path: Input path
+    :return: Puzzle input, a read-only view of the mapped file
+    """
+    return load_grid(path)
+
+
+def parse_input(raw_input: str) -> NDArray[uint8]:
+    """Parse raw puzzle input.
+
+    :param raw_input: Raw puzzle input
+    :return: Puzzle input
+    """
+    return parse_grid(raw_input)
 
 
 if __name__ == "__main__":
@@ -5,40 +5,48 @@ __date__ = "2023"
 __license__ = "MIT"
 
 from functools import cache
+from typing import Iterable
 
 
 def main() -> None:
     """Solve day 12 puzzles."""
     with open("data/day_12_input.txt", encoding="ascii") as input_file:
-        puzzle_input = input_file.readlines()
+        puzzle_input = parse_input(input_file.read())
 
-    star_1(puzzle_input)
+    print(f"Star 1: {star_1(puzzle_input)}")
 
-    star_2(puzzle_input)
+    print(f"Star 2: {star_2(puzzle_input)}")
 
 
-def star_1(puzzle_input: list[str]) -> None:
+def star_1(puzzle_input: list[str]) -> int:
     """Solve the first puzzle."""
     total = 0
     for line in puzzle_input:
         arrangements = compute_valid_arrangements(line)
         total += arrangements
 
-    print(f"Star 1: {total}")
+    return total
 
 
-def star_2(puzzle_input: list[str]) -> None:
+def star_2(puzzle_input: list[str]) -> int:
     """Solve the second puzzle."""
     total = 0
     for line in puzzle_input:
-        graph, damaged = line.split()
-        line = (
-            str(5 * (graph + "?"))[:-1] + " " + str(5 * (damaged + ","))[:-1]
-        )
-        arrangements = compute_valid_arrangements(line)
+        arrangements = compute_valid_arrangements(unfold_line(line))
         total += arrangements
 
-    print(f"Star 2: {total}")
+    return total
+
+
+def solve_stream(lines: Iterable[str]) -> tuple[int, int]:
+    """Solve both puzzles in a single pass over the input lines."""
+    total_1 = 0
+    total_2 = 0
+    for line in lines:
+        total_1 += compute_valid_arrangements(line)
+        total_2 += compute_valid_arrangements(unfold_line(line))
+
+    return total_1, total_2
 
 
 def compute_valid_arrangements(line: str) -> int:
@@ -78,5 +86,17 @@ def find_arrangemets(springs: str, damaged: tuple[int]) -> int:
     return total
 
 
+def parse_input(raw_input: str) -> list[str]:
+    """Parse raw puzzle input."""
+    return raw_input.splitlines(keepends=True)
+
+
+def unfold_line(line: str) -> str:
+    """Unfold the records of a line five times."""
+    graph, damaged = line.split()
+
+    return str(5 * (graph + "?"))[:-1] + " " + str(5 * (damaged + ","))[:-1]
+
+
 if __name__ == "__main__":
     main()
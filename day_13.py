@@ -1,54 +1,50 @@
 """Day 13: Point of Incidence."""
 
+from __future__ import annotations
+
 __author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
 __date__ = "2023"
 __license__ = "MIT"
 
 from collections import Counter
+from typing import TYPE_CHECKING
+
+from aoc.grid import parse_grid
+from aoc.lazy import lazy_import
+
+if TYPE_CHECKING:
+    from numpy import uint8
+    from numpy.typing import NDArray
 
-import numpy as np
-from numpy import uint8
-from numpy.typing import NDArray
+np = lazy_import("numpy")
 
 
 def main() -> None:
     """Solve day 13 puzzles."""
     with open("data/day_13_input.txt", encoding="ascii") as input_file:
-        raw_input = input_file.readlines()
-
-    puzzle_input = []
-    pattern: list[NDArray[uint8]] = []
-    for line in raw_input:
-        line = line.replace(".", "0")
-        line = line.replace("#", "1")
-        if line == "\n":
-            puzzle_input.append(np.array(pattern))
-            pattern = []
-        else:
-            pattern.append(np.array(list(map(int, line.strip()))))
-    puzzle_input.append(np.array(pattern))
+        puzzle_input = parse_input(input_file.read())
 
-    star_1(puzzle_input)
+    print(f"Star 1: {star_1(puzzle_input)}")
 
-    star_2(puzzle_input)
+    print(f"Star 2: {star_2(puzzle_input)}")
 
 
-def star_1(puzzle_input: list[NDArray[uint8]]) -> None:
+def star_1(puzzle_input: list[NDArray[uint8]]) -> int:
     """Solve the first puzzle."""
     total = 0
     for pattern in puzzle_input:
         total += find_mirror(pattern)
 
-    print(f"Star 1: {total}")
+    return total
 
 
-def star_2(puzzle_input: list[NDArray[uint8]]) -> None:
+def star_2(puzzle_input: list[NDArray[uint8]]) -> int:
     """Solve the second puzzle."""
     total = 0
     for pattern in puzzle_input:
         total += find_mirror_smudge(pattern)
 
-    print(f"Star 2: {total}")
+    return total
 
 
 def find_mirror(pattern: NDArray[uint8]) -> int:
@@ -111,5 +107,15 @@ def find_mirror_smudge(pattern: NDArray[uint8]) -> int:
     raise ValueError("Mirror not found!")
 
 
+def parse_input(raw_input: str) -> list[NDArray[uint8]]:
+    """Parse raw puzzle input."""
+    puzzle_input = []
+    for block in raw_input.strip().split("\n\n"):
+        pattern = parse_grid(block) == ord("#")
+        puzzle_input.append(pattern.astype(int))
+
+    return puzzle_input
+
+
 if __name__ == "__main__":
     main()
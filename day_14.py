@@ -1,48 +1,51 @@
 """Day 14: Parabolic Reflector Dish."""
 
+from __future__ import annotations
+
 __author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
 __date__ = "2023"
 __license__ = "MIT"
 
-import numpy as np
-from numpy import uint8
-from numpy.typing import NDArray
+from typing import TYPE_CHECKING
+
+from aoc.grid import parse_grid
+from aoc.lazy import lazy_import
+
+if TYPE_CHECKING:
+    from numpy import uint8
+    from numpy.typing import NDArray
+
+np = lazy_import("numpy")
+
+ROCKS = bytes.maketrans(b".O#", b"\x00\x01\x02")
 
 
 def main() -> None:
     """Solve day 14 puzzles."""
     with open("data/day_14_input.txt", encoding="ascii") as input_file:
-        raw_input = input_file.readlines()
-
-    pattern = []
-    for line in raw_input:
-        line = line.replace(".", "0")
-        line = line.replace("O", "1")
-        line = line.replace("#", "2")
-        pattern.append(np.array(list(map(int, line.strip()))))
-    puzzle_input = np.array(pattern)
+        puzzle_input = parse_input(input_file.read())
 
-    star_1(puzzle_input)
+    print(f"Star 1: {star_1(puzzle_input)}")
 
-    star_2(puzzle_input)
+    print(f"Star 2: {star_2(puzzle_input)}")
 
 
-def star_1(puzzle_input: NDArray[uint8]) -> None:
+def star_1(puzzle_input: NDArray[uint8]) -> int:
     """Solve the first puzzle."""
     tilted = tilt_north(puzzle_input)
 
     weight = get_weight(tilted)
 
-    print(f"Star 1: {weight}")
+    return weight
 
 
-def star_2(puzzle_input: NDArray[uint8]) -> None:
+def star_2(puzzle_input: NDArray[uint8]) -> int:
     """Solve the second puzzle."""
     tilted = spin_cycles(platform=puzzle_input, n_cycles=1000000000)
 
     weight = get_weight(tilted)
 
-    print(f"Star 2: {weight}")
+    return weight
 
 
 def get_weight(platform: NDArray[uint8]) -> int:
@@ -57,6 +60,11 @@ def get_weight(platform: NDArray[uint8]) -> int:
     return total
 
 
+def parse_input(raw_input: str) -> NDArray[uint8]:
+    """Parse raw puzzle input."""
+    return parse_grid(raw_input.encode("ascii").translate(ROCKS)).copy()
+
+
 def spin_cycle(
     platform: tuple[tuple[int, ...], ...]
 ) -> tuple[tuple[int, ...], ...]:
@@ -8,24 +8,24 @@ __license__ = "MIT"
 def main() -> None:
     """Solve day 15 puzzles."""
     with open("data/day_15_input.txt", encoding="ascii") as input_file:
-        puzzle_input = input_file.read().strip()
+        puzzle_input = parse_input(input_file.read())
 
-    star_1(puzzle_input)
+    print(f"Star 1: {star_1(puzzle_input)}")
 
-    star_2(puzzle_input)
+    print(f"Star 2: {star_2(puzzle_input)}")
 
 
-def star_1(puzzle_input: str) -> None:
+def star_1(puzzle_input: str) -> int:
     """Solve the first puzzle."""
     total = 0
 
     for step in puzzle_input.split(","):
         total += step2hash(step)
 
-    print(f"Star 1: {total}")
+    return total
 
 
-def star_2(puzzle_input: str) -> None:
+def star_2(puzzle_input: str) -> int:
     """Solve the second puzzle."""
     boxes = fill_boxes(puzzle_input)
 
@@ -35,7 +35,7 @@ def star_2(puzzle_input: str) -> None:
         for i, value in enumerate(lenses.values()):
             total += (box + 1) * (i + 1) * value
 
-    print(f"Star 2: {total}")
+    return total
 
 
 def char2hash(current_value: int, char: str) -> int:
@@ -67,6 +67,11 @@ def fill_boxes(puzzle_input: str) -> dict[int, dict[str, int]]:
     return boxes
 
 
+def parse_input(raw_input: str) -> str:
+    """Parse raw puzzle input."""
+    return raw_input.strip()
+
+
 def step2hash(step: str) -> int:
     """Convert string to hash value."""
     current_value = 0
@@ -10,21 +10,21 @@ __license__ = "MIT"
 def main() -> None:
     """Solve day 16 puzzles."""
     with open("data/day_16_input.txt", encoding="ascii") as input_file:
-        puzzle_input = [line.strip() for line in input_file.readlines()]
+        puzzle_input = parse_input(input_file.read())
 
-    star_1(puzzle_input)
+    print(f"Star 1: {star_1(puzzle_input)}")
 
-    star_2(puzzle_input)
+    print(f"Star 2: {star_2(puzzle_input)}")
 
 
-def star_1(puzzle_input: list[str]) -> None:
+def star_1(puzzle_input: list[str]) -> int:
     """Solve the first puzzle."""
     energized = get_energized(puzzle_input, (-1, 0))
 
-    print(f"Star 1: {energized}")
+    return energized
 
 
-def star_2(puzzle_input: list[str]) -> None:
+def star_2(puzzle_input: list[str]) -> int:
     """Solve the second puzzle."""
     values = []
 
@@ -36,7 +36,7 @@ def star_2(puzzle_input: list[str]) -> None:
         values.append(get_energized(puzzle_input, (-1, y)))
         values.append(get_energized(puzzle_input, (len(puzzle_input[0]), y)))
 
-    print(f"Star 2: {max(values)}")
+    return max(values)
 
 
 class Beam:
@@ -134,5 +134,10 @@ def get_energized(
     return len(energized)
 
 
+def parse_input(raw_input: str) -> list[str]:
+    """Parse raw puzzle input."""
+    return [line.strip() for line in raw_input.splitlines()]
+
+
 if __name__ == "__main__":
     main()
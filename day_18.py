@@ -8,14 +8,14 @@ __license__ = "MIT"
 def main() -> None:
     """Solve day 18 puzzles."""
     with open("data/day_18_input.txt", encoding="ascii") as input_file:
-        puzzle_input = [line.strip() for line in input_file.readlines()]
+        puzzle_input = parse_input(input_file.read())
 
-    star_1(puzzle_input)
+    print(f"Star 1: {star_1(puzzle_input)}")
 
-    star_2(puzzle_input)
+    print(f"Star 2: {star_2(puzzle_input)}")
 
 
-def star_1(puzzle_input: list[str]) -> None:
+def star_1(puzzle_input: list[str]) -> int:
     """Solve the first puzzle."""
     instructions = []
     for line in puzzle_input:
@@ -27,10 +27,10 @@ def star_1(puzzle_input: list[str]) -> None:
 
     lava = get_lava(trench)
 
-    print(f"Star 1: {lava}")
+    return lava
 
 
-def star_2(puzzle_input: list[str]) -> None:
+def star_2(puzzle_input: list[str]) -> int:
     """Solve the second puzzle."""
     instructions = []
     for line in puzzle_input:
@@ -51,7 +51,7 @@ def star_2(puzzle_input: list[str]) -> None:
 
     lava = get_lava(trench)
 
-    print(f"Star 2: {lava}")
+    return lava
 
 
 def get_lava(trench: list[list[tuple[int, int, str]]]) -> int:
@@ -173,6 +173,11 @@ def get_trench(
     return trench
 
 
+def parse_input(raw_input: str) -> list[str]:
+    """Parse raw puzzle input."""
+    return [line.strip() for line in raw_input.splitlines()]
+
+
 def update_flags(
     character: str,
     in_flag: int,
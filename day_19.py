@@ -18,14 +18,14 @@ MAX_VALUE = 4000
 def main() -> None:
     """Solve day 19 puzzles."""
     with open("data/day_19_input.txt", encoding="ascii") as input_file:
-        puzzle_input = [line.strip() for line in input_file.readlines()]
+        puzzle_input = parse_input(input_file.read())
 
-    star_1(puzzle_input)
+    print(f"Star 1: {star_1(puzzle_input)}")
 
-    star_2(puzzle_input)
+    print(f"Star 2: {star_2(puzzle_input)}")
 
 
-def star_1(puzzle_input: list[str]) -> None:
+def star_1(puzzle_input: list[str]) -> int:
     """Solve the first puzzle."""
     worflows, parts = get_workflows_parts(puzzle_input)
 
@@ -35,10 +35,10 @@ def star_1(puzzle_input: list[str]) -> None:
         if is_accepted(part, worflows):
             total += part.x + part.m + part.a + part.s
 
-    print(f"Star 1: {total}")
+    return total
 
 
-def star_2(puzzle_input: list[str]) -> None:
+def star_2(puzzle_input: list[str]) -> int:
     """Solve the second puzzle."""
 
     worflows, _ = get_workflows_parts(puzzle_input)
@@ -62,7 +62,7 @@ def star_2(puzzle_input: list[str]) -> None:
             * len(accepted_range["s"])
         )
 
-    print(f"Star 2: {total}")
+    return total
 
 
 def get_accepted_ranges(
@@ -154,6 +154,11 @@ def is_accepted(part: Part, workflows: dict[str, Workflow]) -> bool:
     return next_step == "A"
 
 
+def parse_input(raw_input: str) -> list[str]:
+    """Parse raw puzzle input."""
+    return [line.strip() for line in raw_input.splitlines()]
+
+
 class Workflow:
     """Workflow representation."""
 
@@ -1,49 +1,80 @@
 """Day 2: Cube Conundrum."""
 
+from __future__ import annotations
+
 __author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
 __date__ = "2023"
 __license__ = "MIT"
 
+from typing import TYPE_CHECKING, Iterable, NamedTuple
+
+from aoc.lazy import lazy_import
+
+if TYPE_CHECKING:
+    from numpy import int64
+    from numpy.typing import ArrayLike, NDArray
+
+np = lazy_import("numpy")
+
 MAX = {"red": 12, "green": 13, "blue": 14}
 
+COLORS = list(MAX)
+
+# Pairs of games and limits compared at once by a batch query
+BATCH_PAIRS = 2**22
+
+
+class GameTable(NamedTuple):
+    """Columnar table of games."""
+
+    ids: NDArray[int64]
+    max_cubes: NDArray[int64]
+
 
 def main() -> None:
     """Solve day 2 puzzles."""
     with open("data/day_2_input.txt", encoding="ascii") as input_file:
-        puzzle_input = input_file.readlines()
+        puzzle_input = parse_input(input_file.read())
 
-    star_1(puzzle_input)
+    print(f"Star 1: {star_1(puzzle_input)}")
 
-    star_2(puzzle_input)
+    print(f"Star 2: {star_2(puzzle_input)}")
 
 
-def star_1(puzzle_input: list[str]) -> None:
+def star_1(puzzle_input: GameTable) -> int:
     """Solve the first puzzle.
 
     :param puzzle_input: Puzzle input
+    :return: Solution
     """
-    total = 0
+    return int(sum_possible_ids(puzzle_input, [list(MAX.values())])[0])
 
-    for line in puzzle_input:
-        game_id, max_colors = process_line(line)
-        if is_possible(max_colors):
-            total += game_id
-
-    print(f"Star 1: {total}")
 
-
-def star_2(puzzle_input: list[str]) -> None:
+def star_2(puzzle_input: GameTable) -> int:
     """Solve the second puzzle.
 
     :param puzzle_input: Puzzle input
+    :return: Solution
     """
-    total = 0
+    return sum_powers(puzzle_input)
+
 
-    for line in puzzle_input:
-        _, max_colors = process_line(line)
-        total += max_colors["red"] * max_colors["green"] * max_colors["blue"]
+def solve_stream(lines: Iterable[str]) -> tuple[int, int]:
+    """Solve both puzzles in a single pass over the input lines.
+
+    :param lines: Input lines
+    :return: Solutions of both puzzles
+    """
+    total_1 = 0
+    total_2 = 0
+
+    for line in lines:
+        game_id, max_colors = process_line(line)
+        if is_possible(max_colors):
+            total_1 += game_id
+        total_2 += max_colors["red"] * max_colors["green"] * max_colors["blue"]
 
-    print(f"Star 2: {total}")
+    return total_1, total_2
 
 
 def is_possible(max_colors: dict[str, int]) -> bool:
@@ -61,6 +92,26 @@ def is_possible(max_colors: dict[str, int]) -> bool:
     return True
 
 
+def parse_input(raw_input: str) -> GameTable:
+    """Parse raw puzzle input.
+
+    :param raw_input: Raw puzzle input
+    :return: Puzzle input
+    """
+    ids = []
+    max_cubes = []
+
+    for line in raw_input.splitlines():
+        game_id, max_colors = process_line(line)
+        ids.append(game_id)
+        max_cubes.append([max_colors[color] for color in COLORS])
+
+    return GameTable(
+        np.array(ids, dtype=np.int64),
+        np.array(max_cubes, dtype=np.int64).reshape(-1, len(COLORS)),
+    )
+
+
 def process_line(line: str) -> tuple[int, dict[str, int]]:
     """Process line.
 
@@ -80,5 +131,41 @@ def process_line(line: str) -> tuple[int, dict[str, int]]:
     return game_id, max_colors
 
 
+def sum_possible_ids(games: GameTable, limits: ArrayLike) -> NDArray[int64]:
+    """Sum the ids of the games possible under each of many cube limits.
+
+    Limits are compared in blocks sized from the number of games, so the
+    temporary arrays stay bounded however many games there are.
+
+    :param games: Games
+    :param limits: Red, green and blue limit of each query
+    :return: Sum of the possible game ids of each query
+    """
+    limit_array: NDArray[int64] = np.asarray(limits, dtype=np.int64).reshape(
+        -1, len(COLORS)
+    )
+    totals = np.empty(len(limit_array), dtype=np.int64)
+    block_size = max(1, BATCH_PAIRS // max(1, len(games.ids)))
+
+    for start in range(0, len(limit_array), block_size):
+        block = limit_array[start : start + block_size]
+        possible = np.all(
+            games.max_cubes[np.newaxis, :, :] <= block[:, np.newaxis, :],
+            axis=2,
+        )
+        totals[start : start + block_size] = possible @ games.ids
+
+    return totals
+
+
+def sum_powers(games: GameTable) -> int:
+    """Sum the powers of the minimum sets of cubes of the games.
+
+    :param games: Games
+    :return: Sum of powers
+    """
+    return int(games.max_cubes.prod(axis=1).sum())
+
+
 if __name__ == "__main__":
     main()
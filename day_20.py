@@ -15,14 +15,14 @@ from itertools import count
 def main() -> None:
     """Solve day 20 puzzles."""
     with open("data/day_20_input.txt", encoding="ascii") as input_file:
-        puzzle_input = [line.strip() for line in input_file.readlines()]
+        puzzle_input = parse_input(input_file.read())
 
-    star_1(puzzle_input)
+    print(f"Star 1: {star_1(puzzle_input)}")
 
-    star_2(puzzle_input)
+    print(f"Star 2: {star_2(puzzle_input)}")
 
 
-def star_1(puzzle_input: list[str]) -> None:
+def star_1(puzzle_input: list[str]) -> int:
     """Solve the first puzzle."""
     modules = input_2_modules(puzzle_input)
 
@@ -35,10 +35,10 @@ def star_1(puzzle_input: list[str]) -> None:
 
     total = total_low_pulses * total_high_pulses
 
-    print(f"Star 1: {total}")
+    return total
 
 
-def star_2(puzzle_input: list[str]) -> None:
+def star_2(puzzle_input: list[str]) -> int:
     """Solve the second puzzle."""
     modules = input_2_modules(puzzle_input)
 
@@ -55,7 +55,7 @@ def star_2(puzzle_input: list[str]) -> None:
 
     total_cycles = lcm(*cycle_lengths)
 
-    print(f"Star 2: {total_cycles}")
+    return total_cycles
 
 
 class Module(ABC):
@@ -167,6 +167,11 @@ def input_2_modules(input_value: list[str]) -> dict[str, Module]:
     return modules
 
 
+def parse_input(raw_input: str) -> list[str]:
+    """Parse raw puzzle input."""
+    return [line.strip() for line in raw_input.splitlines()]
+
+
 def press_button(modules: dict[str, Module]) -> tuple[int, int]:
     """Execute one button press cycle."""
     low_pulses = 1
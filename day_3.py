@@ -1,133 +1,245 @@
 """Day 3: Gear Ratios."""
 
+from __future__ import annotations
+
 __author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
 __date__ = "2023"
 __license__ = "MIT"
 
-from typing import Optional
+from typing import TYPE_CHECKING, NamedTuple
+
+from aoc.grid import load_grid, parse_grid
+from aoc.lazy import lazy_import
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from numpy import bool_, int64, uint8
+    from numpy.typing import NDArray
+
+np = lazy_import("numpy")
+
+NEIGHBOURS = [(d_i, d_j) for d_i in (-1, 0, 1) for d_j in (-1, 0, 1)]
+
+
+class SymbolIndex(NamedTuple):
+    """Numbers adjacent to each symbol, in compressed sparse rows."""
+
+    symbols: NDArray[uint8]
+    cells: NDArray[int64]
+    offsets: NDArray[int64]
+    labels: NDArray[int64]
+    values: NDArray[int64]
 
 
 def main() -> None:
     """Solve day 3 puzzles."""
     with open("data/day_3_input.txt", encoding="ascii") as input_file:
-        raw_input = input_file.readlines()
+        puzzle_input = parse_input(input_file.read())
 
-    puzzle_input = pad_input(raw_input)
+    print(f"Star 1: {star_1(puzzle_input)}")
 
-    star_1(puzzle_input)
+    print(f"Star 2: {star_2(puzzle_input)}")
 
-    star_2(puzzle_input)
 
-
-def star_1(puzzle_input: list[str]) -> None:
+def star_1(puzzle_input: NDArray[uint8]) -> int:
     """Solve the first puzzle.
 
     :param puzzle_input: Puzzle input
+    :return: Solution
     """
-    total = 0
-
-    for i, line in enumerate(puzzle_input):
-        for j, char in enumerate(line):
-            if char.isdigit() and not line[j - 1].isdigit():
-                number = get_number(line=line, j=j)
-                total += get_value(puzzle_input, number, i, j)
+    labels, values = label_numbers(puzzle_input)
+    near_symbol = dilate(get_symbols(puzzle_input))
+    part_labels = np.unique(labels[near_symbol & (labels > 0)])
 
-    print(f"Star 1: {total}")
+    return int(values[part_labels].sum())
 
 
-def star_2(puzzle_input: list[str]) -> None:
+def star_2(puzzle_input: NDArray[uint8]) -> int:
     """Solve the second puzzle.
 
     :param puzzle_input: Puzzle input
+    :return: Solution
     """
-    total = 0
+    index = build_symbol_index(puzzle_input)
+    starts = index.offsets[get_symbols_with_neighbours(index, 2, "*")]
 
-    gears: dict[tuple[int, int], list[int]] = {}
+    return int(
+        (
+            index.values[index.labels[starts]]
+            * index.values[index.labels[starts + 1]]
+        ).sum()
+    )
 
-    for i, line in enumerate(puzzle_input):
-        for j, char in enumerate(line):
-            if char.isdigit() and not line[j - 1].isdigit():
-                number = get_number(line=line, j=j)
-                gear = get_gear(puzzle_input, number, i, j)
-                if gear:
-                    gears.setdefault(gear, []).append(int(number))
 
-    for gear, numbers in gears.items():
-        if len(numbers) == 2:
-            total += numbers[0] * numbers[1]
+def build_symbol_index(grid: NDArray[uint8]) -> SymbolIndex:
+    """Index the numbers adjacent to every symbol of a padded grid.
 
-    print(f"Star 2: {total}")
+    :param grid: Grid padded with periods
+    :return: Symbol index, symbols in row-major order
+    """
+    labels, values = label_numbers(grid)
+    symbols = get_symbols(grid)
+    cells, cell_labels = get_adjacent_labels(labels, symbols)
 
+    # Adjacencies are sorted by cell like the symbols
+    symbol_cells = np.flatnonzero(symbols)
+    offsets = np.searchsorted(cells, np.r_[symbol_cells, grid.size])
 
-def get_gear(
-    puzzle_input: list[str], number: str, i: int, j: int
-) -> Optional[tuple[int, int]]:
-    """Get coordinate of gear.
+    return SymbolIndex(
+        grid.ravel()[symbol_cells], symbol_cells, offsets, cell_labels, values
+    )
 
-    :param puzzle_input: Puzzle input
-    :param number: Number
-    :param i: Number start line
-    :param j: Number start column
-    :return: Coordinates if gear, None otherwise
+
+def dilate(mask: NDArray[bool_]) -> NDArray[bool_]:
+    """Extend a mask of a padded grid to the neighbours of its cells.
+
+    :param mask: Mask, false on the border
+    :return: Mask of the cells and of their neighbours
     """
-    for ii in range(i - 1, i + 2):
-        for jj in range(j - 1, j + len(number) + 1):
-            if puzzle_input[ii][jj] == "*":
-                return (ii, jj)
+    dilated = mask.copy()
+    rows, columns = mask.shape
+
+    for d_i, d_j in NEIGHBOURS:
+        dilated[1:-1, 1:-1] |= mask[
+            1 + d_i : rows - 1 + d_i, 1 + d_j : columns - 1 + d_j
+        ]
 
-    return None
+    return dilated
 
 
-def get_number(line: str, j: int) -> str:
-    """Get complete number.
+def get_adjacent_labels(
+    labels: NDArray[int64], symbols: NDArray[bool_]
+) -> tuple[NDArray[int64], NDArray[int64]]:
+    """Get the labels of the numbers adjacent to symbols.
 
-    :param line: Line
-    :param j: Number start index
-    :return: Complete number
+    :param labels: Number labels of a padded grid
+    :param symbols: Mask of the symbols, false on the border
+    :return: Flat index of the symbol cell and label of the number of
+        every distinct adjacency
     """
-    number = ""
-    k = 0
-    while line[j + k].isdigit():
-        number += line[j + k]
-        k += 1
+    columns = labels.shape[1]
+    symbol_i, symbol_j = np.nonzero(symbols)
 
-    return number
+    cells = np.tile(symbol_i * columns + symbol_j, len(NEIGHBOURS))
+    cell_labels = np.concatenate(
+        [labels[symbol_i + d_i, symbol_j + d_j] for d_i, d_j in NEIGHBOURS]
+    )
 
+    adjacent = cell_labels > 0
+    pairs = np.unique(
+        np.stack([cells[adjacent], cell_labels[adjacent]]), axis=1
+    )
 
-def get_value(puzzle_input: list[str], number: str, i: int, j: int) -> int:
-    """Get value of number.
+    return pairs[0], pairs[1]
 
-    :param puzzle_input: Puzzle input
-    :param number: Number
-    :param i: Number start line
-    :param j: Number start column
-    :return: Number if valid, 0 otherwise
+
+def get_adjacent_numbers(
+    index: SymbolIndex, symbol: str | None = None
+) -> NDArray[int64]:
+    """Get the numbers adjacent to symbols.
+
+    :param index: Symbol index
+    :param symbol: Symbol, any if None
+    :return: Sorted labels of the numbers adjacent to the symbols
+    """
+    labels = index.labels
+    if symbol is not None:
+        labels = labels[
+            np.repeat(index.symbols == ord(symbol), np.diff(index.offsets))
+        ]
+
+    return np.unique(labels)
+
+
+def get_symbols_with_neighbours(
+    index: SymbolIndex, count: int, symbol: str | None = None
+) -> NDArray[int64]:
+    """Get the symbols adjacent to an exact number of numbers.
+
+    :param index: Symbol index
+    :param count: Number of adjacent numbers
+    :param symbol: Symbol, any if None
+    :return: Positions of the symbols in the index
+    """
+    matches = np.diff(index.offsets) == count
+    if symbol is not None:
+        matches &= index.symbols == ord(symbol)
+
+    return np.flatnonzero(matches)
+
+
+def get_symbols(grid: NDArray[uint8]) -> NDArray[bool_]:
+    """Get the mask of the symbols of a grid.
+
+    :param grid: Grid
+    :return: Mask of the cells neither digits nor periods
     """
-    for ii in range(i - 1, i + 2):
-        for jj in range(j - 1, j + len(number) + 1):
-            if (
-                not puzzle_input[ii][jj].isdigit()
-                and puzzle_input[ii][jj] != "."
-            ):
-                return int(number)
+    return ~is_digit(grid) & (grid != ord("."))
+
 
-    return 0
+def is_digit(grid: NDArray[uint8]) -> NDArray[bool_]:
+    """Get the mask of the digits of a grid.
+
+    :param grid: Grid
+    :return: Mask of the digit cells
+    """
+    # Bytes below "0" wrap around to large values
+    return grid - ord("0") < 10
 
 
-def pad_input(raw_input: list[str]) -> list[str]:
-    """Pad input.
+def label_numbers(
+    grid: NDArray[uint8],
+) -> tuple[NDArray[int64], NDArray[int64]]:
+    """Label the numbers of a padded grid.
 
-    :param raw_input: Puzzle input
-    :return: Padded input
+    Runs of digits start at digits not preceded by another digit, and the
+    border keeps runs from spanning two rows, so the grid is labeled as a
+    single flat array.
+
+    :param grid: Grid padded with periods
+    :return: Label of the number of each cell, 0 if none, and value of
+        each label, starting from 0
+    """
+    digits = is_digit(grid).ravel()
+    starts = digits & ~np.r_[False, digits[:-1]]
+    labels = np.cumsum(starts) * digits
+
+    run_starts = np.flatnonzero(starts[digits])
+    run_lengths = np.diff(np.r_[run_starts, digits.sum()])
+    run_ids = labels[digits] - 1
+    exponents = (
+        run_lengths[run_ids]
+        - 1
+        - (np.arange(len(run_ids)) - run_starts[run_ids])
+    )
+    terms = (grid.ravel()[digits] - ord("0")).astype(np.int64) * (
+        10**exponents
+    )
+
+    values = np.zeros(len(run_starts) + 1, dtype=np.int64)
+    if len(run_starts):
+        values[1:] = np.add.reduceat(terms, run_starts)
+
+    return labels.reshape(grid.shape), values
+
+
+def parse_file(path: Path | str) -> NDArray[uint8]:
+    """Parse a memory-mapped puzzle input file.
+
+    :param path: Input path
+    :return: Puzzle input
     """
-    matrix_input = []
+    return load_grid(path, pad=1)
 
-    matrix_input.append("." * (len(raw_input[0]) + 1))
-    for line in raw_input:
-        matrix_input.append("." + line.strip() + ".")
-    matrix_input.append("." * (len(raw_input[0]) + 1))
 
-    return matrix_input
+def parse_input(raw_input: str) -> NDArray[uint8]:
+    """Parse raw puzzle input.
+
+    :param raw_input: Raw puzzle input
+    :return: Puzzle input
+    """
+    return parse_grid(raw_input, pad=1)
 
 
 if __name__ == "__main__":
@@ -1,68 +1,293 @@
 "Day 4: Scratchcards"
 
+from __future__ import annotations
+
 __author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
 __date__ = "2023"
 __license__ = "MIT"
 
+from collections import deque
+from itertools import chain
+from typing import TYPE_CHECKING, Iterable, NamedTuple, Sequence
+
+from aoc.grid import parse_grid
+from aoc.lazy import lazy_import
+
+if TYPE_CHECKING:
+    from numpy import int64, uint8
+    from numpy.typing import NDArray
+
+np = lazy_import("numpy")
+
+# Bit of every card number, all below 100
+NUMBER_BITS = {str(number): 1 << number for number in range(100)}
+
+# Cards whose number tables are built at once
+CARDS_BLOCK = 2**16
+
+
+class CardTable(NamedTuple):
+    """Numbers of the cards, one row per card."""
+
+    winning: NDArray[int64]
+    mine: NDArray[int64]
+
+
+class Cascade(NamedTuple):
+    """Scratchcards counted so far and copies won by them."""
+
+    total: int
+    copies: int
+    ends: tuple[int, ...]
+
 
 def main() -> None:
     """Solve day 4 puzzles."""
     with open("data/day_4_input.txt", encoding="ascii") as input_file:
-        puzzle_input = input_file.readlines()
+        puzzle_input = parse_input(input_file.read())
 
-    star_1(puzzle_input)
+    print(f"Star 1: {star_1(puzzle_input)}")
 
-    star_2(puzzle_input)
+    print(f"Star 2: {star_2(puzzle_input)}")
 
 
-def star_1(puzzle_input: list[str]) -> None:
+def star_1(puzzle_input: CardTable) -> int:
     """Solve the first puzzle.
 
     :param puzzle_input: Puzzle input
+    :return: Solution
     """
-    total = 0
-
-    for line in puzzle_input:
-        winning_numbers, my_numbers = parse_line(line)
-        value = 0
-        for number in my_numbers:
-            if number in winning_numbers:
-                value = max(1, value * 2)
-        total += value
+    matches = count_matches(puzzle_input)
 
-    print(f"Star 1: {total}")
+    return int((1 << (matches[matches > 0] - 1)).sum())
 
 
-def star_2(puzzle_input: list[str]) -> None:
+def star_2(puzzle_input: CardTable) -> int:
     """Solve the second puzzle.
 
     :param puzzle_input: Puzzle input
+    :return: Solution
+    """
+    return count_scratchcards(count_matches(puzzle_input).tolist())
+
+
+def solve_stream(lines: Iterable[str]) -> tuple[int, int]:
+    """Solve both puzzles in a single pass over the input lines.
+
+    The points of each card are added up while its matches are fed to the
+    copy cascade, so no card is kept.
+
+    :param lines: Input lines
+    :return: Solutions of both puzzles
+    """
+    total_1 = 0
+
+    def add_points(line: str) -> int:
+        nonlocal total_1
+        matches = get_matches(parse_line(line))
+        if matches:
+            total_1 += 2 ** (matches - 1)
+        return matches
+
+    total_2 = count_scratchcards(map(add_points, lines))
+
+    return total_1, total_2
+
+
+def solve_chunk(lines: Iterable[str]) -> tuple[int, bytes]:
+    """Solve the first puzzle over a chunk of the input lines.
+
+    The second puzzle depends on the cards preceding the chunk, so the
+    number of matches of every card is returned for the reduction.
+
+    :param lines: Input lines
+    :return: Partial solution of the first puzzle and matches of each card
+    """
+    total = 0
+    matches = bytearray()
+
+    for line in lines:
+        card_matches = get_matches(parse_line(line))
+        if card_matches:
+            total += 2 ** (card_matches - 1)
+        matches.append(card_matches)
+
+    return total, bytes(matches)
+
+
+def reduce_chunks(partials: Sequence[tuple[int, bytes]]) -> tuple[int, int]:
+    """Combine the results of consecutive chunks.
+
+    :param partials: Results of the chunks, in input order
+    :return: Solutions of both puzzles
+    """
+    total_1 = sum(total for total, _ in partials)
+    total_2 = count_scratchcards(
+        chain.from_iterable(matches for _, matches in partials)
+    )
+
+    return total_1, total_2
+
+
+def fold_chunk(
+    state: tuple[int, int, Cascade] | None, partial: tuple[int, bytes]
+) -> tuple[int, int, Cascade]:
+    """Fold the result of the next chunk into the running state.
+
+    The copy cascade of the previous chunks is resumed, so only the
+    matches of the new cards are fed to it.
+
+    :param state: Solutions and copy cascade of the previous chunks, None
+        if none
+    :param partial: Result of the next chunk
+    :return: Solutions and copy cascade including the chunk
+    """
+    total_1, _, cascade = state or (0, 0, Cascade(0, 0, ()))
+    total, matches = partial
+    cascade = resume_scratchcards(cascade, matches)
+
+    return total_1 + total, cascade.total, cascade
+
+
+def count_scratchcards(matches: Iterable[int]) -> int:
+    """Count the scratchcards won, including the original ones.
+
+    :param matches: Number of matches of each card
+    :return: Total number of scratchcards
+    """
+    return resume_scratchcards(Cascade(0, 0, ()), matches).total
+
+
+def resume_scratchcards(cascade: Cascade, matches: Iterable[int]) -> Cascade:
+    """Feed the next cards to a copy cascade.
+
+    The copies won by each card are kept as a difference array: they are
+    added to a running count and removed after the last card they apply
+    to, so the count takes linear time whatever the number of matches.
+
+    :param cascade: Cascade of the previous cards
+    :param matches: Number of matches of each next card
+    :return: Cascade including the next cards
+    """
+    total, copies, _ = cascade
+    ends = deque(cascade.ends)
+
+    for card_matches in matches:
+        copies -= ends.popleft() if ends else 0
+        quantity = 1 + copies
+        total += quantity
+        if card_matches:
+            copies += quantity
+            ends.extend([0] * (card_matches + 1 - len(ends)))
+            ends[card_matches] += quantity
+
+    return Cascade(total, copies, tuple(ends))
+
+
+def count_matches(cards: CardTable) -> NDArray[int64]:
+    """Count the matches of every card.
+
+    The numbers of each block of cards are marked in two boolean tables,
+    one row per card and one column per number, so the matches are the
+    row sums of their intersection.
+
+    :param cards: Cards
+    :return: Number of my numbers that are winning numbers, per card
     """
-    scratchcards = dict.fromkeys(list(range(1, len(puzzle_input) + 1)), 1)
+    matches = np.empty(len(cards.winning), dtype=np.int64)
 
-    for scratchcard, quantity in scratchcards.items():
-        winning_numbers, my_numbers = parse_line(puzzle_input[scratchcard - 1])
-        index = 1
-        for number in my_numbers:
-            if number in winning_numbers:
-                scratchcards[scratchcard + index] += quantity
-                index += 1
+    for start in range(0, len(matches), CARDS_BLOCK):
+        winning = cards.winning[start : start + CARDS_BLOCK]
+        mine = cards.mine[start : start + CARDS_BLOCK]
+        rows = np.arange(len(winning))[:, np.newaxis]
+        winning_table = np.zeros((len(winning), 100), dtype=bool)
+        winning_table[rows, winning] = True
+        mine_table = np.zeros_like(winning_table)
+        mine_table[rows, mine] = True
+        matches[start : start + CARDS_BLOCK] = (
+            winning_table & mine_table
+        ).sum(axis=1)
 
-    total = sum(scratchcards.values())
+    return matches
 
-    print(f"Star 2: {total}")
 
+def get_matches(card: tuple[int, int]) -> int:
+    """Count the matches of a card.
 
-def parse_line(line: str) -> tuple[set[str], set[str]]:
+    :param card: Winning numbers and my numbers, as bitmasks
+    :return: Number of my numbers that are winning numbers
+    """
+    winning_numbers, my_numbers = card
+    return (winning_numbers & my_numbers).bit_count()
+
+
+def parse_input(raw_input: str) -> CardTable:
+    """Parse raw puzzle input.
+
+    :param raw_input: Raw puzzle input
+    :return: Puzzle input
+    """
+    grid = parse_grid(raw_input)
+    colon = grid[0].tobytes().find(b":")
+    separator = grid[0].tobytes().find(b"|")
+
+    if (
+        colon < 0
+        or separator < 0
+        or np.any(grid[:, colon] != ord(":"))
+        or np.any(grid[:, separator] != ord("|"))
+    ):
+        raise ValueError("Invalid input!")
+
+    return CardTable(
+        read_numbers(grid[:, colon + 1 : separator - 1]),
+        read_numbers(grid[:, separator + 1 :]),
+    )
+
+
+def parse_line(line: str) -> tuple[int, int]:
     """Parse a line of numbers.
 
     :param line: Input line
-    :return: Winning numbers and my numbers
+    :return: Winning numbers and my numbers, as bitmasks
     """
     winning_str, my_str = line.strip().split(": ")[1].split(" | ")
-    winning_numbers = set(filter(None, winning_str.split(" ")))
-    my_numbers = set(filter(None, my_str.split(" ")))
-    return winning_numbers, my_numbers
+    return to_bitmask(winning_str), to_bitmask(my_str)
+
+
+def read_numbers(columns: NDArray[uint8]) -> NDArray[int64]:
+    """Read columns of numbers below 100, each right-aligned after a space.
+
+    :param columns: Grid columns of the numbers
+    :return: Numbers, one row per grid row
+    """
+    if columns.shape[1] % 3:
+        raise ValueError("Invalid input!")
+
+    fields = columns.reshape(len(columns), -1, 3).astype(np.int16)
+    digits = np.where(fields == ord(" "), 0, fields - ord("0"))
+
+    if np.any(fields[:, :, 0] != ord(" ")) or np.any(
+        (digits < 0) | (digits > 9)
+    ):
+        raise ValueError("Invalid input!")
+
+    return (digits[:, :, 1] * 10 + digits[:, :, 2]).astype(np.int64)
+
+
+def to_bitmask(numbers_str: str) -> int:
+    """Convert numbers to a bitmask.
+
+    :param numbers_str: Space-separated numbers
+    :return: Bitmask with the bit of every number set
+    """
+    bitmask = 0
+    try:
+        for number in numbers_str.split():
+            bitmask |= NUMBER_BITS[number]
+    except KeyError as error:
+        raise ValueError("Invalid input!") from error
+    return bitmask
 
 
 if __name__ == "__main__":
@@ -4,6 +4,8 @@ __author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
 __date__ = "2023"
 __license__ = "MIT"
 
+from bisect import bisect_right
+
 STEPS = [
     "seed-to-soil",
     "soil-to-fertilizer",
@@ -14,74 +16,53 @@ STEPS = [
     "humidity-to-location",
 ]
 
+Almanac = tuple[list[int], dict[str, list[tuple[int, ...]]]]
+
 
 def main() -> None:
     """Solve day 5 puzzles."""
     with open("data/day_5_input.txt", encoding="ascii") as input_file:
-        puzzle_input = input_file.read()
-
-    puzzle_input = puzzle_input.replace("seeds: ", "")
-    seeds = list(map(int, puzzle_input.split("\n\n")[0].strip().split(" ")))
-
-    maps = compute_maps(puzzle_input)
+        puzzle_input = parse_input(input_file.read())
 
-    star_1(seeds, maps)
+    print(f"Star 1: {star_1(puzzle_input)}")
 
-    star_2(seeds, maps)
+    print(f"Star 2: {star_2(puzzle_input)}")
 
 
-def star_1(seeds: list[int], maps: dict[str, list[tuple[int, ...]]]) -> None:
+def star_1(puzzle_input: Almanac) -> int:
     """Solve the first puzzle.
 
-    :param seeds: Input seeds
-    :param maps: Dictionary of lists of (destination, source, range) tuples
+    :param puzzle_input: Input seeds and dictionary of lists of
+        (destination, source, range) tuples
+    :return: Solution
     """
+    seeds, maps = puzzle_input
+
     locations = set()
 
     for seed in seeds:
         locations.add(seed_to_location(seed, maps))
 
-    print(f"Star 1: {min(locations)}")
+    return min(locations)
 
 
-def star_2(seeds: list[int], maps: dict[str, list[tuple[int, ...]]]) -> None:
+def star_2(puzzle_input: Almanac) -> int:
     """Solve the second puzzle.
 
-    :param seeds: Input seeds
-    :param maps: Dictionary of lists of (destination, source, range) tuples
+    :param puzzle_input: Input seeds and dictionary of lists of
+        (destination, source, range) tuples
+    :return: Solution
     """
-    seed_splits = find_splits(maps, 0)
-
-    seeds_to_check = set()
+    seeds, maps = puzzle_input
 
-    for i in range(0, len(seeds), 2):
-        seeds_to_check.add(seeds[i])
-        for split in seed_splits:
-            if split in range(seeds[i], seeds[i] + seeds[i + 1]):
-                seeds_to_check.add(split)
+    intervals = [
+        (seeds[i], seeds[i] + seeds[i + 1]) for i in range(0, len(seeds), 2)
+    ]
 
-    locations = set()
-
-    for seed in seeds_to_check:
-        locations.add(seed_to_location(seed, maps))
-
-    print(f"Star 2: {min(locations)}")
-
-
-def apply_inverse_map(
-    input_destination: int, map_: list[tuple[int, ...]]
-) -> int:
-    """Apply a map.
-
-    :param input_destination: Input destination
-    :param map_: List of (destination, source, range) tuples
-    :return: Output destination
-    """
-    for destination, source, range_ in map_:
-        if destination <= input_destination < destination + range_:
-            return input_destination + source - destination
+    for step in STEPS:
+        intervals = apply_map_to_intervals(intervals, maps[step])
 
-    return input_destination
+    return intervals[0][0]
 
 
 def apply_map(input_source: int, map_: list[tuple[int, ...]]) -> int:
@@ -98,6 +79,44 @@ def apply_map(input_source: int, map_: list[tuple[int, ...]]) -> int:
     return input_source
 
 
+def apply_map_to_intervals(
+    intervals: list[tuple[int, int]], map_: list[tuple[int, ...]]
+) -> list[tuple[int, int]]:
+    """Apply a map to intervals, splitting them at the map ranges.
+
+    :param intervals: List of (start, end) intervals, end excluded
+    :param map_: List of (destination, source, range) tuples, sorted by
+        source
+    :return: Sorted and merged list of (start, end) output intervals
+    """
+    mapped = []
+
+    for start, end in intervals:
+        # First map range not ending before the interval
+        i = bisect_right(map_, start, key=lambda entry: entry[1])
+        if i and start < map_[i - 1][1] + map_[i - 1][2]:
+            i -= 1
+
+        while start < end:
+            if i == len(map_) or end <= map_[i][1]:
+                mapped.append((start, end))
+                break
+
+            destination, source, range_ = map_[i]
+            if start < source:
+                mapped.append((start, source))
+                start = source
+
+            stop = min(end, source + range_)
+            mapped.append(
+                (start + destination - source, stop + destination - source)
+            )
+            start = stop
+            i += 1
+
+    return merge_intervals(mapped)
+
+
 def compute_maps(
     puzzle_input: str,
 ) -> dict[str, list[tuple[int, ...]]]:
@@ -120,40 +139,35 @@ def compute_maps(
     return maps
 
 
-def find_splits(maps: dict[str, list[tuple[int, ...]]], i: int) -> set[int]:
-    """Find the splits of the ith level.
+def merge_intervals(intervals: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Merge overlapping and adjacent intervals.
 
-    :param maps: Dictionary of lists of (destination, source, range) tuples
-    :param i: Index of the level
-    :return: Splits
+    :param intervals: List of (start, end) intervals, end excluded
+    :return: Sorted list of disjoint (start, end) intervals
     """
-    splits = set()
-    for _, source, range_ in maps[STEPS[i]]:
-        splits.add(source)
-        splits.add(source + range_)
-    i += 1
-    if i < len(STEPS):
-        destination_splits = find_splits(maps, i)
-        for destination_split in destination_splits:
-            splits.add(
-                apply_inverse_map(destination_split, maps[STEPS[i - 1]])
-            )
-    return splits
+    merged: list[tuple[int, int]] = []
 
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
 
-def location_to_seed(
-    location: int, maps: dict[str, list[tuple[int, ...]]]
-) -> int:
-    """Convert location to seed.
+    return merged
 
-    :param location: Location
-    :param maps: Dictionary of lists of (destination, source, range) tuples
-    :return: Seed
+
+def parse_input(raw_input: str) -> Almanac:
+    """Parse raw puzzle input.
+
+    :param raw_input: Raw puzzle input
+    :return: Puzzle input
     """
-    for step in reversed(STEPS):
-        location = apply_inverse_map(location, maps[step])
+    puzzle_input = raw_input.replace("seeds: ", "")
+    seeds = list(map(int, puzzle_input.split("\n\n")[0].strip().split(" ")))
+
+    maps = compute_maps(puzzle_input)
 
-    return location
+    return seeds, maps
 
 
 def seed_to_location(seed: int, maps: dict[str, list[tuple[int, ...]]]) -> int:
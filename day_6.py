@@ -10,17 +10,18 @@ import math
 def main() -> None:
     """Solve day 6 puzzles."""
     with open("data/day_6_input.txt", encoding="ascii") as input_file:
-        puzzle_input = input_file.readlines()
+        puzzle_input = parse_input(input_file.read())
 
-    star_1(puzzle_input)
+    print(f"Star 1: {star_1(puzzle_input)}")
 
-    star_2(puzzle_input)
+    print(f"Star 2: {star_2(puzzle_input)}")
 
 
-def star_1(puzzle_input: list[str]) -> None:
+def star_1(puzzle_input: list[str]) -> int:
     """Solve the first puzzle.
 
     :param puzzle_input: Puzzle input
+    :return: Solution
     """
     races = get_races(puzzle_input)
 
@@ -34,13 +35,14 @@ def star_1(puzzle_input: list[str]) -> None:
             x1 -= 1
         total *= math.floor(x1) - math.ceil(x0) + 1
 
-    print(f"Star 1: {total}")
+    return total
 
 
-def star_2(puzzle_input: list[str]) -> None:
+def star_2(puzzle_input: list[str]) -> int:
     """Solve the second puzzle.
 
     :param puzzle_input: Puzzle input
+    :return: Solution
     """
     race = get_race(puzzle_input)
 
@@ -51,7 +53,7 @@ def star_2(puzzle_input: list[str]) -> None:
         x1 -= 1
     ways_to_win = math.floor(x1) - math.ceil(x0) + 1
 
-    print(f"Star 2: {ways_to_win}")
+    return ways_to_win
 
 
 def get_race(puzzle_input: list[str]) -> tuple[int, int]:
@@ -79,6 +81,15 @@ def get_races(puzzle_input: list[str]) -> list[tuple[int, int]]:
     return races
 
 
+def parse_input(raw_input: str) -> list[str]:
+    """Parse raw puzzle input.
+
+    :param raw_input: Raw puzzle input
+    :return: Puzzle input
+    """
+    return raw_input.splitlines(keepends=True)
+
+
 def solve_inequality(race: tuple[int, int]) -> tuple[float, float]:
     """Solve a 2nd degree integer inequality.
 
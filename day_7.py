@@ -5,6 +5,7 @@ __date__ = "2023"
 __license__ = "MIT"
 
 from collections import Counter
+from typing import Iterable
 
 CARDS_1 = {
     "A": 14,
@@ -42,17 +43,18 @@ CARDS_2 = {
 def main() -> None:
     """Solve day 7 puzzles."""
     with open("data/day_7_input.txt", encoding="ascii") as input_file:
-        puzzle_input = input_file.readlines()
+        puzzle_input = parse_input(input_file.read())
 
-    star_1(puzzle_input)
+    print(f"Star 1: {star_1(puzzle_input)}")
 
-    star_2(puzzle_input)
+    print(f"Star 2: {star_2(puzzle_input)}")
 
 
-def star_1(puzzle_input: list[str]) -> None:
+def star_1(puzzle_input: list[str]) -> int:
     """Solve the first puzzle.
 
     :param puzzle_input: Puzzle input
+    :return: Solution
     """
     hands = []
 
@@ -67,13 +69,14 @@ def star_1(puzzle_input: list[str]) -> None:
     for i, hand in enumerate(hands):
         total += hand[1] * (i + 1)
 
-    print(f"Star 1: {total}")
+    return total
 
 
-def star_2(puzzle_input: list[str]) -> None:
+def star_2(puzzle_input: list[str]) -> int:
     """Solve the second puzzle.
 
     :param puzzle_input: Puzzle input
+    :return: Solution
     """
     hands = []
 
@@ -88,7 +91,37 @@ def star_2(puzzle_input: list[str]) -> None:
     for i, hand in enumerate(hands):
         total += hand[1] * (i + 1)
 
-    print(f"Star 2: {total}")
+    return total
+
+
+def solve_stream(lines: Iterable[str]) -> tuple[int, int]:
+    """Solve both puzzles in a single pass over the input lines.
+
+    Hands are grouped by value, so memory is bounded by the number of
+    distinct hands rather than by the number of lines. Each group keeps
+    its count, the sum of its bids and the sum of its bids weighted by
+    their order of appearance, which is enough to rank equal hands as a
+    stable sort would.
+
+    :param lines: Input lines
+    :return: Solutions of both puzzles
+    """
+    groups_1: dict[int, list[int]] = {}
+    groups_2: dict[int, list[int]] = {}
+
+    for line in lines:
+        cards, bid_str = line.split()
+        bid = int(bid_str)
+        for groups, value in [
+            (groups_1, cards2value_1(cards)),
+            (groups_2, cards2value_2(cards)),
+        ]:
+            group = groups.setdefault(value, [0, 0, 0])
+            group[0] += 1
+            group[1] += bid
+            group[2] += bid * group[0]
+
+    return get_winnings(groups_1), get_winnings(groups_2)
 
 
 # pylint: disable-next=too-many-return-statements
@@ -189,5 +222,31 @@ def cards2value_2(cards: str) -> int:
     )
 
 
+def get_winnings(groups: dict[int, list[int]]) -> int:
+    """Get the total winnings of hands grouped by value.
+
+    :param groups: Count, bid sum and weighted bid sum of each hand value
+    :return: Total winnings
+    """
+    total = 0
+    rank = 0
+
+    for value in sorted(groups):
+        quantity, bids, weighted_bids = groups[value]
+        total += rank * bids + weighted_bids
+        rank += quantity
+
+    return total
+
+
+def parse_input(raw_input: str) -> list[str]:
+    """Parse raw puzzle input.
+
+    :param raw_input: Raw puzzle input
+    :return: Puzzle input
+    """
+    return raw_input.splitlines(keepends=True)
+
+
 if __name__ == "__main__":
     main()
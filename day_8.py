@@ -10,17 +10,18 @@ import math
 def main() -> None:
     """Solve day 8 puzzles."""
     with open("data/day_8_input.txt", encoding="ascii") as input_file:
-        puzzle_input = input_file.readlines()
+        puzzle_input = parse_input(input_file.read())
 
-    star_1(puzzle_input)
+    print(f"Star 1: {star_1(puzzle_input)}")
 
-    star_2(puzzle_input)
+    print(f"Star 2: {star_2(puzzle_input)}")
 
 
-def star_1(puzzle_input: list[str]) -> None:
+def star_1(puzzle_input: list[str]) -> int:
     """Solve the first puzzle.
 
     :param puzzle_input: Puzzle input
+    :return: Solution
     """
     instructions = puzzle_input[0].strip()
     raw_nodes = puzzle_input[2:]
@@ -36,13 +37,14 @@ def star_1(puzzle_input: list[str]) -> None:
             node = nodes[node][1]
         step += 1
 
-    print(f"Star 1: {step}")
+    return step
 
 
-def star_2(puzzle_input: list[str]) -> None:
+def star_2(puzzle_input: list[str]) -> int:
     """Solve the second puzzle.
 
     :param puzzle_input: Puzzle input
+    :return: Solution
     """
     instructions = puzzle_input[0].strip()
     raw_nodes = puzzle_input[2:]
@@ -68,7 +70,7 @@ def star_2(puzzle_input: list[str]) -> None:
 
     global_step = math.lcm(*cycle_lengths)
 
-    print(f"Star 2: {math.lcm(global_step)}")
+    return global_step
 
 
 def get_nodes(raw_nodes: list[str]) -> dict[str, tuple[str, str]]:
@@ -88,5 +90,14 @@ def get_nodes(raw_nodes: list[str]) -> dict[str, tuple[str, str]]:
     return nodes
 
 
+def parse_input(raw_input: str) -> list[str]:
+    """Parse raw puzzle input.
+
+    :param raw_input: Raw puzzle input
+    :return: Puzzle input
+    """
+    return raw_input.splitlines(keepends=True)
+
+
 if __name__ == "__main__":
     main()
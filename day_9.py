@@ -4,41 +4,61 @@ __author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
 __date__ = "2023"
 __license__ = "MIT"
 
+from typing import Iterable
+
 
 def main() -> None:
     """Solve day 9 puzzles."""
     with open("data/day_9_input.txt", encoding="ascii") as input_file:
-        puzzle_input = input_file.readlines()
+        puzzle_input = parse_input(input_file.read())
 
-    star_1(puzzle_input)
+    print(f"Star 1: {star_1(puzzle_input)}")
 
-    star_2(puzzle_input)
+    print(f"Star 2: {star_2(puzzle_input)}")
 
 
-def star_1(puzzle_input: list[str]) -> None:
+def star_1(puzzle_input: list[str]) -> int:
     """Solve the first puzzle.
 
     :param puzzle_input: Puzzle input
+    :return: Solution
     """
     total = 0
     for line in puzzle_input:
         sequence = list(map(int, line.split()))
         total += estrapolate(sequence)
 
-    print(f"Star 1: {total}")
+    return total
 
 
-def star_2(puzzle_input: list[str]) -> None:
+def star_2(puzzle_input: list[str]) -> int:
     """Solve the second puzzle.
 
     :param puzzle_input: Puzzle input
+    :return: Solution
     """
     total = 0
     for line in puzzle_input:
         sequence = list(map(int, line.split()))
         total += backward_estrapolate(sequence)
 
-    print(f"Star 2: {total}")
+    return total
+
+
+def solve_stream(lines: Iterable[str]) -> tuple[int, int]:
+    """Solve both puzzles in a single pass over the input lines.
+
+    :param lines: Input lines
+    :return: Solutions of both puzzles
+    """
+    total_1 = 0
+    total_2 = 0
+    for line in lines:
+        sequence = list(map(int, line.split()))
+        total_1 += estrapolate(sequence)
+        total_2 += backward_estrapolate(sequence)
+
+    return total_1, total_2
 
 
 def estrapolate(sequence: list[int]) -> int:
@@ -73,5 +93,14 @@ def backward_estrapolate(sequence: list[int]) -> int:
     return sequence[0]
 
 
+def parse_input(raw_input: str) -> list[str]:
+    """Parse raw puzzle input.
+
+    :param raw_input: Raw puzzle input
+    :return: Puzzle input
+    """
+    return raw_input.splitlines(keepends=True)
+
+
 if __name__ == "__main__":
     main()